@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 import requests
 from pydantic import BaseModel
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, Any
 from local_calculate import LocalCalculate, calculate_chart
 from predictions import generate_yearly_predictions
@@ -422,8 +423,8 @@ def week_prediction(data: BirthData) -> Dict[str, Any]:
         # Calculate weekly overview
         if daily_predictions:
             avg_rating = sum(d["rating"] for d in daily_predictions) / len(daily_predictions)
-            best_day = max(daily_predictions, key=lambda x: x["rating"])
-            worst_day = min(daily_predictions, key=lambda x: x["rating"])
+            best_day = max(daily_predictions, key=itemgetter("rating"))
+            worst_day = min(daily_predictions, key=itemgetter("rating"))
         else:
             avg_rating = 5
             best_day = worst_day = None
@@ -500,8 +501,8 @@ def quarter_prediction(data: BirthData) -> Dict[str, Any]:
         # Calculate quarter overview
         if quarterly_predictions:
             avg_rating = sum(p["overall_rating"] for p in quarterly_predictions) / len(quarterly_predictions)
-            best_month = max(quarterly_predictions, key=lambda x: x["overall_rating"])
-            worst_month = min(quarterly_predictions, key=lambda x: x["overall_rating"])
+            best_month = max(quarterly_predictions, key=itemgetter("overall_rating"))
+            worst_month = min(quarterly_predictions, key=itemgetter("overall_rating"))
             
             # Aggregate scores by area
             area_trends = {}
@@ -1182,6 +1183,38 @@ def monthly_horoscope(data: BirthData) -> Dict[str, Any]:
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
+@app.post("/horoscope/full")
+def full_horoscope(data: BirthData) -> Dict[str, Any]:
+    """
+    Full Horoscope - Daily, Weekly and Monthly Outlook in One Call
+    
+    Returns the same payloads as /horoscope/daily, /horoscope/weekly and
+    /horoscope/monthly under "daily", "weekly" and "monthly", all computed
+    for the same instant.
+    
+    Example:
+    {
+        "date_of_birth": "1990-05-15",
+        "time_of_birth": "14:30",
+        "place_of_birth": "New Delhi, India"
+    }
+    """
+    try:
+        from predictions import generate_full_forecast
+        
+        lat, lon = geocode_location(data.place_of_birth)
+        
+        return generate_full_forecast(
+            birth_date=data.date_of_birth,
+            birth_time=data.time_of_birth,
+            lat=lat,
+            lon=lon
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
     
 class LotteryRequest(BaseModel):
     date_of_birth: str
@@ -5,8 +5,10 @@ Performs essential calculations without API calls
 
 import swisseph as swe
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any
 import math
+import numpy as np
 import pytz
 
 # Set ephemeris path (download from https://www.astro.com/ftp/swisseph/ephe/)
@@ -42,6 +44,14 @@ ZODIAC_SIGNS = [
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
 ]
 
+NAKSHATRAS = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+]
+
 # Swiss Ephemeris planet IDs
 PLANET_IDS = {
     PlanetName.SUN: swe.SUN,
@@ -58,6 +68,28 @@ PLANET_IDS = {
 # Ayanamsa (precession correction) - Lahiri
 AYANAMSA = swe.SIDM_LAHIRI
 
+# Size of the memo caches around the Swiss Ephemeris primitives
+EPHEMERIS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE_SIZE)
+def _ayanamsa(jd: float) -> float:
+    """Cached Lahiri ayanamsa, keyed on a rounded Julian Day"""
+    swe.set_sid_mode(AYANAMSA)
+    return swe.get_ayanamsa(jd)
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE_SIZE)
+def _calc_ut(jd: float, planet_id: int) -> Tuple[float, ...]:
+    """Cached tropical position/speed of a planet, keyed on a rounded Julian Day"""
+    return tuple(swe.calc_ut(jd, planet_id)[0])
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE_SIZE)
+def _houses(jd: float, lat: float, lon: float) -> Tuple[float, ...]:
+    """Cached tropical house cusps, keyed on rounded Julian Day and location"""
+    return tuple(swe.houses(jd, lat, lon)[0])
+
 
 class LocalCalculate:
     """Local Vedic Astrology Calculator"""
@@ -71,8 +103,7 @@ class LocalCalculate:
     @staticmethod
     def get_ayanamsa(jd: float) -> float:
         """Get Ayanamsa (precession correction) for given Julian Day"""
-        swe.set_sid_mode(AYANAMSA)
-        return swe.get_ayanamsa(jd)
+        return _ayanamsa(round(jd, 6))
     
     @staticmethod
     def get_planet_longitude(planet_name: str, jd: float, ayanamsa: float) -> float:
@@ -80,8 +111,7 @@ class LocalCalculate:
         if planet_name not in PLANET_IDS:
             raise ValueError(f"Unknown planet: {planet_name}")
         
-        planet_id = PLANET_IDS[planet_name]
-        result = swe.calc_ut(jd, planet_id)[0]
+        result = _calc_ut(round(jd, 6), PLANET_IDS[planet_name])
         
         # Get tropical longitude
         tropical_long = result[0]
@@ -99,6 +129,48 @@ class LocalCalculate:
             
         return nirayana_long
     
+    @staticmethod
+    def get_planet_longitudes_batch(planets: List[str], jds: np.ndarray,
+                                    ayanamsas: np.ndarray) -> np.ndarray:
+        """Get Nirayana longitudes as a (len(jds) x len(planets)) array"""
+        for planet_name in planets:
+            if planet_name not in PLANET_IDS:
+                raise ValueError(f"Unknown planet: {planet_name}")
+        
+        planet_ids = [PLANET_IDS[p] for p in planets]
+        tropical = np.array([
+            [_calc_ut(round(float(jd), 6), planet_id)[0] for planet_id in planet_ids]
+            for jd in jds
+        ])
+        
+        nirayana = tropical - np.asarray(ayanamsas)[:, None]
+        
+        # Ketu is always opposite Rahu
+        ketu_cols = [i for i, p in enumerate(planets) if p == PlanetName.KETU]
+        if ketu_cols:
+            nirayana[:, ketu_cols] += 180
+        
+        return np.mod(nirayana, 360)
+    
+    @staticmethod
+    def get_all_planet_longitudes(jd: float, ayanamsa: float) -> np.ndarray:
+        """Get Nirayana longitudes of every planet in PLANET_IDS order"""
+        return LocalCalculate.get_planet_longitudes_batch(
+            list(PLANET_IDS), np.array([jd]), np.array([ayanamsa])
+        )[0]
+    
+    @staticmethod
+    def get_planet_houses_batch(longitudes: np.ndarray, house_cusps: np.ndarray) -> np.ndarray:
+        """Vectorized get_planet_house: one row of cusps per row of longitudes"""
+        cusps = np.asarray(house_cusps)
+        # Measure everything from the 1st cusp so the cusps become sorted
+        rel_cusps = np.mod(cusps - cusps[:, :1], 360)
+        rel_longs = np.mod(longitudes - cusps[:, :1], 360)
+        return np.array([
+            np.searchsorted(rel_cusps[i], rel_longs[i], side="right")
+            for i in range(len(cusps))
+        ])
+    
     @staticmethod
     def longitude_to_sign(longitude: float) -> Tuple[str, float]:
         """Convert longitude to zodiac sign and degrees in sign"""
@@ -110,7 +182,7 @@ class LocalCalculate:
     def get_ascendant(jd: float, lat: float, lon: float, ayanamsa: float) -> float:
         """Calculate Ascendant (Lagna)"""
         # Get houses using Placidus system
-        houses = swe.houses(jd, lat, lon)[0]
+        houses = _houses(round(jd, 6), round(lat, 4), round(lon, 4))
         tropical_asc = houses[0]  # First house cusp is Ascendant
         
         # Convert to sidereal
@@ -123,7 +195,7 @@ class LocalCalculate:
     @staticmethod
     def get_house_cusps(jd: float, lat: float, lon: float, ayanamsa: float) -> List[float]:
         """Get all 12 house cusps in Nirayana"""
-        houses = swe.houses(jd, lat, lon)[0]
+        houses = _houses(round(jd, 6), round(lat, 4), round(lon, 4))
         nirayana_houses = []
         
         for house in houses:
@@ -155,14 +227,6 @@ class LocalCalculate:
     @staticmethod
     def get_nakshatra(longitude: float) -> Tuple[str, int]:
         """Get Nakshatra (constellation) and pada"""
-        NAKSHATRAS = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-            "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-            "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-            "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
-            "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-        ]
-        
         nakshatra_index = int(longitude / 13.333333)
         pada = int((longitude % 13.333333) / 3.333333) + 1
         
@@ -174,8 +238,7 @@ class LocalCalculate:
         if planet_name in [PlanetName.SUN, PlanetName.MOON, PlanetName.RAHU, PlanetName.KETU]:
             return False  # These don't go retrograde
         
-        planet_id = PLANET_IDS[planet_name]
-        result = swe.calc_ut(jd, planet_id)[0]
+        result = _calc_ut(round(jd, 6), PLANET_IDS[planet_name])
         speed = result[3]  # Speed in longitude
         
         return speed < 0
@@ -3,14 +3,14 @@ Australian Lottery Predictions based on Vedic Astrology
 Enhanced with deeper astronomical calculations
 """
 
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
 import random
 import logging
+import time
 from collections import Counter
-import swisseph as swe
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,11 @@ LOTTERY_CONFIGS = {
     }
 }
 
+# Per-lottery circuit breaker for the stats scraper: after a failed fetch we
+# skip HTTP until this timestamp and go straight to the statistical fallback
+SCRAPE_BLOCK_SECONDS = 300
+_SCRAPE_BLOCK_UNTIL = {lottery: 0.0 for lottery in LOTTERY_CONFIGS}
+
 # Planetary number associations (Vedic Astrology)
 PLANET_NUMBERS = {
     "Sun": [1, 10, 19, 28, 37],
@@ -113,31 +118,47 @@ HOUSE_LUCK_WEIGHTS = {
 }
 
 
+def _build_generic_hot_numbers(number_range: Tuple[int, int], seed: int = 0) -> Tuple[int, ...]:
+    """Build the 15 generic hot numbers for a range (primes, mid-range, seeded fill)"""
+    min_num, max_num = number_range
+    rng = random.Random(seed)
+    hot_numbers = []
+    
+    # Use prime numbers
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    for p in primes:
+        if min_num <= p <= max_num:
+            hot_numbers.append(p)
+    
+    # Add mid-range numbers
+    mid_range = list(range(min_num + 10, max_num - 10, 3))
+    hot_numbers.extend(mid_range[:10])
+    
+    while len(hot_numbers) < 15:
+        num = rng.randint(min_num, max_num)
+        if num not in hot_numbers:
+            hot_numbers.append(num)
+    
+    return tuple(sorted(hot_numbers[:15]))
+
+
+# Generic hot numbers are fixed per number range, so build them once at import
+_GENERIC_HOT_BY_RANGE = {
+    config["main_numbers"]["range"]: _build_generic_hot_numbers(config["main_numbers"]["range"])
+    for config in LOTTERY_CONFIGS.values()
+}
+
+
 class HotNumbersScraper:
     """Scrape hot numbers from lottery statistics"""
     
     @staticmethod
     def get_generic_hot_numbers(lottery_type: str, number_range: Tuple[int, int]) -> List[int]:
         """Generate statistically distributed hot numbers"""
-        min_num, max_num = number_range
-        hot_numbers = []
-        
-        # Use prime numbers
-        primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
-        for p in primes:
-            if min_num <= p <= max_num:
-                hot_numbers.append(p)
-        
-        # Add mid-range numbers
-        mid_range = list(range(min_num + 10, max_num - 10, 3))
-        hot_numbers.extend(mid_range[:10])
-        
-        while len(hot_numbers) < 15:
-            num = random.randint(min_num, max_num)
-            if num not in hot_numbers:
-                hot_numbers.append(num)
-        
-        return sorted(hot_numbers[:15])
+        hot_numbers = _GENERIC_HOT_BY_RANGE.get(tuple(number_range))
+        if hot_numbers is None:
+            hot_numbers = _build_generic_hot_numbers(number_range)
+        return list(hot_numbers)
     
     @staticmethod
     def scrape_oz_lotteries_stats(lottery_type: str) -> Dict[str, Any]:
@@ -146,23 +167,33 @@ class HotNumbersScraper:
         if not config:
             return {"hot_numbers": [], "source": "none"}
         
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(
-                config.get("hot_numbers_url", ""),
-                headers=headers,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                logger.info(f"Successfully fetched stats for {lottery_type}")
-            
-        except Exception as e:
-            logger.warning(f"Could not scrape hot numbers for {lottery_type}: {e}")
+        # Imported lazily so importing this module doesn't pay for them
+        import requests
+        from bs4 import BeautifulSoup
+        
+        if time.time() < _SCRAPE_BLOCK_UNTIL[lottery_type]:
+            logger.debug(f"Skipping hot numbers scrape for {lottery_type} (circuit open)")
+        else:
+            try:
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                }
+                
+                response = requests.get(
+                    config.get("hot_numbers_url", ""),
+                    headers=headers,
+                    timeout=(2, 3)  # (connect, read)
+                )
+                
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.content, 'html.parser')
+                    logger.info(f"Successfully fetched stats for {lottery_type}")
+                else:
+                    _SCRAPE_BLOCK_UNTIL[lottery_type] = time.time() + SCRAPE_BLOCK_SECONDS
+                
+            except Exception as e:
+                _SCRAPE_BLOCK_UNTIL[lottery_type] = time.time() + SCRAPE_BLOCK_SECONDS
+                logger.warning(f"Could not scrape hot numbers for {lottery_type}: {e}")
         
         # Fallback to generated hot numbers
         main_range = config["main_numbers"]["range"]
@@ -318,7 +349,7 @@ class VedicLotteryPredictor:
                     lucky_numbers.append(degree)
                 
                 # Also use rounded degree
-                rounded_degree = round(degree / 5) * 5  # Round to nearest 5
+                rounded_degree = ((degree + 2) // 5) * 5  # Round to nearest 5
                 if min_num <= rounded_degree <= max_num:
                     lucky_numbers.append(rounded_degree)
         
@@ -345,7 +376,8 @@ def generate_lottery_predictions(
     chart: Dict[str, Any],
     lottery_type: str,
     user_name: str = "",
-    num_sets: int = 1
+    num_sets: int = 1,
+    hot_stats: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Generate lottery number predictions using:
@@ -354,6 +386,8 @@ def generate_lottery_predictions(
     3. Moon's nakshatra
     4. Hot numbers from statistics
     5. Numerology
+    
+    hot_stats can be passed in when the statistics were already fetched.
     """
     
     config = LOTTERY_CONFIGS.get(lottery_type)
@@ -361,7 +395,8 @@ def generate_lottery_predictions(
         raise ValueError(f"Unknown lottery type: {lottery_type}")
     
     # Get hot numbers
-    hot_stats = HotNumbersScraper.scrape_oz_lotteries_stats(lottery_type)
+    if hot_stats is None:
+        hot_stats = HotNumbersScraper.scrape_oz_lotteries_stats(lottery_type)
     hot_numbers = hot_stats.get("hot_numbers", [])
     
     # Get astrological lucky numbers using multiple methods
@@ -411,7 +446,7 @@ def generate_lottery_predictions(
     
     # Generate multiple sets
     sets = []
-    sorted_numbers = sorted(number_weights.items(), key=lambda x: x[1], reverse=True)
+    sorted_numbers = sorted(number_weights.items(), key=itemgetter(1), reverse=True)
     
     for set_num in range(num_sets):
         # Create unique seed for this set
@@ -486,6 +521,17 @@ def generate_lottery_predictions(
         sets.append(set_result)
         random.seed()  # Reset
     
+    # Single pass over planets for the key factors summary
+    planets_in_11th, planets_in_5th, exalted_planets = [], [], []
+    for planet_name, planet_data in chart.get("planets", {}).items():
+        house = planet_data.get("house")
+        if house == 11:
+            planets_in_11th.append(planet_name)
+        elif house == 5:
+            planets_in_5th.append(planet_name)
+        if planet_data.get("dignity") == "exalted":
+            exalted_planets.append(planet_name)
+    
     result = {
         "lottery_type": config["name"],
         "num_sets": num_sets,
@@ -500,9 +546,9 @@ def generate_lottery_predictions(
             "dasha_period_weight": "5%"
         },
         "key_astrological_factors": {
-            "planets_in_11th_house": [p for p, d in chart.get("planets", {}).items() if d.get("house") == 11],
-            "planets_in_5th_house": [p for p, d in chart.get("planets", {}).items() if d.get("house") == 5],
-            "exalted_planets": [p for p, d in chart.get("planets", {}).items() if d.get("dignity") == "exalted"],
+            "planets_in_11th_house": planets_in_11th,
+            "planets_in_5th_house": planets_in_5th,
+            "exalted_planets": exalted_planets,
             "moon_nakshatra": chart.get("planets", {}).get("Moon", {}).get("nakshatra", "")
         },
         "lucky_number_sources": {
@@ -558,9 +604,19 @@ def generate_all_lottery_predictions(chart: Dict[str, Any], user_name: str = "",
     """Generate predictions for all Australian lotteries"""
     predictions = {}
     
+    # The stats scrapes are network-bound, so fetch them for all lotteries at
+    # once; the number generation itself stays sequential (it seeds `random`)
+    with ThreadPoolExecutor(max_workers=len(LOTTERY_CONFIGS)) as executor:
+        hot_stats_by_type = dict(zip(
+            LOTTERY_CONFIGS,
+            executor.map(HotNumbersScraper.scrape_oz_lotteries_stats, LOTTERY_CONFIGS)
+        ))
+    
     for lottery_type in LOTTERY_CONFIGS.keys():
         try:
-            prediction = generate_lottery_predictions(chart, lottery_type, user_name, num_sets)
+            prediction = generate_lottery_predictions(
+                chart, lottery_type, user_name, num_sets, hot_stats_by_type[lottery_type]
+            )
             predictions[lottery_type] = prediction
         except Exception as e:
             logger.error(f"Error generating prediction for {lottery_type}: {e}")
@@ -4,18 +4,31 @@ HTTP-based server that can work independently or with Claude Desktop
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Final, List, Optional
+from datetime import datetime, timedelta
 
 import httpx
+import msgspec
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 import uvicorn
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Response caching is optional
+    aioredis = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,389 +39,504 @@ logger = logging.getLogger("vedastro-mcp")
 # Configuration
 VEDASTRO_API_URL = os.environ.get("VEDASTRO_API_URL", "http://vedastro-api:8087")
 MCP_PORT = int(os.environ.get("MCP_PORT", "8585"))
+MCP_WORKERS = int(os.environ.get("MCP_WORKERS", str(os.cpu_count() or 1)))
+MCP_HTTPX_MAX_KEEPALIVE = int(os.environ.get("MCP_HTTPX_MAX_KEEPALIVE", "50"))
+MCP_HTTPX_MAX_CONNECTIONS = int(os.environ.get("MCP_HTTPX_MAX_CONNECTIONS", "200"))
+MCP_REDIS_URL = os.environ.get("MCP_REDIS_URL", "")
+MCP_LOCAL_CACHE_SIZE = int(os.environ.get("MCP_LOCAL_CACHE_SIZE", "1024"))
+MCP_LOCAL_CACHE_TTL = float(os.environ.get("MCP_LOCAL_CACHE_TTL", "60"))
+MCP_HEALTH_INTERVAL = float(os.environ.get("MCP_HEALTH_INTERVAL", "5"))
+
+# Response cache TTLs (seconds) per tool; UNTIL_MIDNIGHT expires at the end of
+# the local day. Tools not listed here (wildcard, lottery numbers) are not cached.
+UNTIL_MIDNIGHT = -1
+TOOL_CACHE_TTL = {
+    "get_birth_chart": 30 * 24 * 3600,
+    "get_today_prediction": UNTIL_MIDNIGHT,
+    "get_weekly_prediction": 6 * 3600,
+    "get_monthly_prediction": 6 * 3600,
+    "get_yearly_prediction": UNTIL_MIDNIGHT,
+    "get_love_prediction": UNTIL_MIDNIGHT,
+    "get_career_prediction": UNTIL_MIDNIGHT,
+    "get_wealth_prediction": UNTIL_MIDNIGHT,
+    "get_health_prediction": UNTIL_MIDNIGHT,
+    "get_lottery_types": 3600,
+}
+
+
+class LocalTTLCache:
+    """Small in-process LRU with per-entry expiry, checked before Redis"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+local_cache = LocalTTLCache(MCP_LOCAL_CACHE_SIZE, MCP_LOCAL_CACHE_TTL)
+
+
+async def health_loop(app: FastAPI):
+    """Probe the Vedic Astrology API periodically and cache the result"""
+    while True:
+        try:
+            response = await app.state.http.get("/", timeout=5.0)
+            api_status = "healthy" if response.status_code == 200 else "unhealthy"
+        except Exception as e:
+            api_status = f"unhealthy: {str(e)}"
+        # Timestamp is formatted here once per probe, not per /health request
+        app.state.upstream_health = (api_status, datetime.now().isoformat())
+        await asyncio.sleep(MCP_HEALTH_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    # One pooled client for all upstream calls so connections are kept alive
+    # HTTP/2 lets concurrent tool calls multiplex over one connection when
+    # the upstream supports it; plain http:// URLs stay on HTTP/1.1
+    app.state.http = httpx.AsyncClient(
+        base_url=VEDASTRO_API_URL,
+        http2=True,
+        headers={"Accept-Encoding": "br, gzip"},
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=MCP_HTTPX_MAX_KEEPALIVE,
+            max_connections=MCP_HTTPX_MAX_CONNECTIONS,
+            keepalive_expiry=30
+        )
+    )
+    app.state.redis = None
+    if MCP_REDIS_URL and aioredis is not None:
+        app.state.redis = aioredis.from_url(MCP_REDIS_URL)
+        logger.info("Response cache enabled")
+    app.state.upstream_health = ("unknown", datetime.now().isoformat())
+    health_task = asyncio.create_task(health_loop(app))
+    try:
+        yield
+    finally:
+        health_task.cancel()
+        await app.state.http.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Vedic Astrology MCP Server",
     description="Standalone MCP server for astrological calculations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
-class ToolRequest(BaseModel):
+class ToolRequest(msgspec.Struct):
     tool_name: str
     arguments: Dict[str, Any]
 
 
+# ToolRequest isn't a Pydantic model, so describe the body for the docs by hand
+TOOL_REQUEST_SCHEMA = {
+    "type": "object",
+    "required": ["tool_name", "arguments"],
+    "properties": {
+        "tool_name": {"type": "string"},
+        "arguments": {"type": "object"}
+    }
+}
+
+
 class ToolResponse(BaseModel):
     success: bool
-    data: Optional[Dict[str, Any]] = None
+    data: Any = None
     error: Optional[str] = None
 
 
 # Helper function to call the Vedic Astrology API
 async def call_vedastro_api(endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Call the Vedic Astrology API"""
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                f"{VEDASTRO_API_URL}{endpoint}",
-                json=data
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"API call failed: {e}")
-            raise
+    response = await app.state.http.post(endpoint, json=data)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def stream_vedastro_api(endpoint: str, data: Dict[str, Any]) -> StreamingResponse:
+    """Call the Vedic Astrology API and stream its JSON body straight through"""
+    request = app.state.http.build_request("POST", endpoint, json=data)
+    response = await app.state.http.send(request, stream=True)
+    if response.is_error:
+        await response.aread()
+        await response.aclose()
+        response.raise_for_status()
+    return StreamingResponse(
+        response.aiter_bytes(),
+        status_code=response.status_code,
+        media_type="application/json",
+        background=BackgroundTask(response.aclose)
+    )
+
+
+def _cache_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Build the Redis key for a tool call"""
+    digest = hashlib.sha256(orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f"mcp:{tool_name}:{digest}"
+
+
+def _cache_ttl(tool_name: str) -> Optional[int]:
+    """Seconds to cache a tool's result, or None if it shouldn't be cached"""
+    ttl = TOOL_CACHE_TTL.get(tool_name)
+    if ttl == UNTIL_MIDNIGHT:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        ttl = max(int((midnight - now).total_seconds()), 1)
+    return ttl
+
+
+async def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Read a cached result; cache failures are treated as misses"""
+    try:
+        cached = await app.state.redis.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed: %s", e)
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+async def _cache_set(key: str, ttl: int, result: Dict[str, Any]) -> None:
+    """Store a result in the cache; failures are logged and ignored"""
+    try:
+        await app.state.redis.setex(key, ttl, orjson.dumps(result))
+    except Exception as e:
+        logger.warning("Cache write failed: %s", e)
+
+
+# Static payloads are serialized once at import time
+_ROOT_JSON = orjson.dumps({
+    "service": "Vedic Astrology MCP Server",
+    "version": "1.0.0",
+    "status": "running",
+    "api_url": VEDASTRO_API_URL,
+    "endpoints": {
+        "tools": "/tools",
+        "execute": "/execute",
+        "health": "/health",
+        "docs": "/docs"
+    }
+})
 
 
 @app.get("/")
 async def root():
     """Root endpoint with server info"""
-    return {
-        "service": "Vedic Astrology MCP Server",
-        "version": "1.0.0",
-        "status": "running",
-        "api_url": VEDASTRO_API_URL,
-        "endpoints": {
-            "tools": "/tools",
-            "execute": "/execute",
-            "health": "/health",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    try:
-        # Check if API is reachable
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{VEDASTRO_API_URL}/")
-            api_status = "healthy" if response.status_code == 200 else "unhealthy"
-    except Exception as e:
-        api_status = f"unhealthy: {str(e)}"
+    """Health check endpoint (upstream status comes from health_loop)"""
+    api_status, checked_at = app.state.upstream_health
     
     return {
         "mcp_server": "healthy",
         "vedastro_api": api_status,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": checked_at
     }
 
 
-@app.get("/tools")
-async def list_tools():
-    """List all available MCP tools"""
-    return {
-        "tools": [
-            {
-                "name": "get_birth_chart",
-                "description": "Get a complete birth chart with planetary positions, houses, and nakshatras",
-                "category": "chart",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": []
-            },
-            {
-                "name": "get_today_prediction",
-                "description": "Get today's astrological prediction with ratings for love, career, wealth, and health",
-                "category": "predictions",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": []
-            },
-            {
-                "name": "get_weekly_prediction",
-                "description": "Get 7-day forecast with day-by-day breakdown",
-                "category": "predictions",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": []
-            },
-            {
-                "name": "get_monthly_prediction",
-                "description": "Get current month's detailed prediction with transit analysis",
-                "category": "predictions",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": []
-            },
-            {
-                "name": "get_yearly_prediction",
-                "description": "Get 12-month comprehensive forecast",
-                "category": "predictions",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": []
-            },
-            {
-                "name": "get_love_prediction",
-                "description": "Get love and relationship predictions (up to 12 months)",
-                "category": "area_specific",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": ["start_date", "end_date"]
-            },
-            {
-                "name": "get_career_prediction",
-                "description": "Get career and professional predictions (up to 12 months)",
-                "category": "area_specific",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": ["start_date", "end_date"]
-            },
-            {
-                "name": "get_wealth_prediction",
-                "description": "Get wealth and financial predictions (up to 12 months)",
-                "category": "area_specific",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": ["start_date", "end_date"]
-            },
-            {
-                "name": "get_health_prediction",
-                "description": "Get health and wellness predictions (up to 12 months)",
-                "category": "area_specific",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": ["start_date", "end_date"]
-            },
-            {
-                "name": "get_wildcard_prediction",
-                "description": "Get precise predictions for specific events with success probability",
-                "category": "wildcard",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth", "query"],
-                "optional_fields": ["specific_date"]
-            },
-            {
-                "name": "get_lottery_types",
-                "description": "Get all available Australian lottery types and configurations",
-                "category": "lottery",
-                "required_fields": [],
-                "optional_fields": []
-            },
-            {
-                "name": "predict_lottery_numbers",
-                "description": "Predict lucky lottery numbers for specific Australian lottery",
-                "category": "lottery",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth", "lottery_type"],
-                "optional_fields": ["user_name", "num_sets"]
-            },
-            {
-                "name": "predict_all_lotteries",
-                "description": "Predict lucky numbers for ALL Australian lotteries",
-                "category": "lottery",
-                "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
-                "optional_fields": ["user_name", "num_sets"]
-            }
-        ]
+# Tool catalogue served by /tools
+TOOLS = [
+    {
+        "name": "get_birth_chart",
+        "description": "Get a complete birth chart with planetary positions, houses, and nakshatras",
+        "category": "chart",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": []
+    },
+    {
+        "name": "get_today_prediction",
+        "description": "Get today's astrological prediction with ratings for love, career, wealth, and health",
+        "category": "predictions",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": []
+    },
+    {
+        "name": "get_weekly_prediction",
+        "description": "Get 7-day forecast with day-by-day breakdown",
+        "category": "predictions",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": []
+    },
+    {
+        "name": "get_monthly_prediction",
+        "description": "Get current month's detailed prediction with transit analysis",
+        "category": "predictions",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": []
+    },
+    {
+        "name": "get_yearly_prediction",
+        "description": "Get 12-month comprehensive forecast",
+        "category": "predictions",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": []
+    },
+    {
+        "name": "get_love_prediction",
+        "description": "Get love and relationship predictions (up to 12 months)",
+        "category": "area_specific",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": ["start_date", "end_date"]
+    },
+    {
+        "name": "get_career_prediction",
+        "description": "Get career and professional predictions (up to 12 months)",
+        "category": "area_specific",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": ["start_date", "end_date"]
+    },
+    {
+        "name": "get_wealth_prediction",
+        "description": "Get wealth and financial predictions (up to 12 months)",
+        "category": "area_specific",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": ["start_date", "end_date"]
+    },
+    {
+        "name": "get_health_prediction",
+        "description": "Get health and wellness predictions (up to 12 months)",
+        "category": "area_specific",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": ["start_date", "end_date"]
+    },
+    {
+        "name": "get_wildcard_prediction",
+        "description": "Get precise predictions for specific events with success probability",
+        "category": "wildcard",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth", "query"],
+        "optional_fields": ["specific_date"]
+    },
+    {
+        "name": "get_lottery_types",
+        "description": "Get all available Australian lottery types and configurations",
+        "category": "lottery",
+        "required_fields": [],
+        "optional_fields": []
+    },
+    {
+        "name": "predict_lottery_numbers",
+        "description": "Predict lucky lottery numbers for specific Australian lottery",
+        "category": "lottery",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth", "lottery_type"],
+        "optional_fields": ["user_name", "num_sets"]
+    },
+    {
+        "name": "predict_all_lotteries",
+        "description": "Predict lucky numbers for ALL Australian lotteries",
+        "category": "lottery",
+        "required_fields": ["date_of_birth", "time_of_birth", "place_of_birth"],
+        "optional_fields": ["user_name", "num_sets"]
     }
+]
+_TOOLS_JSON = orjson.dumps({"tools": TOOLS})
 
 
-@app.post("/execute", response_model=ToolResponse)
-async def execute_tool(request: ToolRequest):
-    """Execute a specific MCP tool"""
-    
-    # Map tool names to API endpoints
-    endpoint_map = {
-        "get_birth_chart": "/chart/complete",
-        "get_today_prediction": "/predictions/today",
-        "get_weekly_prediction": "/predictions/week",
-        "get_monthly_prediction": "/predictions/current-month",
-        "get_yearly_prediction": "/predictions/yearly",
-        "get_love_prediction": "/predictions/love",
-        "get_career_prediction": "/predictions/career",
-        "get_wealth_prediction": "/predictions/wealth",
-        "get_health_prediction": "/predictions/health",
-        "get_wildcard_prediction": "/predictions/wildcard",
-        "get_lottery_types": "/lottery/types",
-        "predict_lottery_numbers": "/lottery/predict",
-        "predict_all_lotteries": "/lottery/predict-all",
-    }
-    
-    tool_name = request.tool_name
-    endpoint = endpoint_map.get(tool_name)
-    
-    if not endpoint:
+@app.get("/tools")
+async def list_tools():
+    """List all available MCP tools"""
+    return Response(content=_TOOLS_JSON, media_type="application/json")
+
+
+# Map tool names to API endpoints
+ENDPOINT_MAP: Final[Dict[str, str]] = {
+    "get_birth_chart": "/chart/complete",
+    "get_today_prediction": "/predictions/today",
+    "get_weekly_prediction": "/predictions/week",
+    "get_monthly_prediction": "/predictions/current-month",
+    "get_yearly_prediction": "/predictions/yearly",
+    "get_love_prediction": "/predictions/love",
+    "get_career_prediction": "/predictions/career",
+    "get_wealth_prediction": "/predictions/wealth",
+    "get_health_prediction": "/predictions/health",
+    "get_wildcard_prediction": "/predictions/wildcard",
+    "get_lottery_types": "/lottery/types",
+    "predict_lottery_numbers": "/lottery/predict",
+    "predict_all_lotteries": "/lottery/predict-all",
+}
+VALID_TOOLS: Final[frozenset] = frozenset(ENDPOINT_MAP)
+
+
+async def _dispatch(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a tool against the Vedic Astrology API, using the response cache"""
+    if tool_name not in VALID_TOOLS:
         raise HTTPException(
             status_code=400,
             detail=f"Unknown tool: {tool_name}. Use /tools to see available tools."
         )
+    endpoint = ENDPOINT_MAP[tool_name]
+    
+    # Cacheable tools check the in-process cache first, then Redis
+    ttl = _cache_ttl(tool_name)
+    use_redis = ttl and app.state.redis is not None
+    if ttl:
+        key = _cache_key(tool_name, arguments)
+        result = local_cache.get(key)
+        if result is not None:
+            return result
+        if use_redis:
+            result = await _cache_get(key)
+            if result is not None:
+                local_cache.set(key, result, ttl)
+                return result
+    
+    logger.info("Executing tool: %s with endpoint: %s", tool_name, endpoint)
+    result = await call_vedastro_api(endpoint, arguments)
+    
+    if ttl:
+        local_cache.set(key, result, ttl)
+        if use_redis:
+            await _cache_set(key, ttl, result)
+    
+    return result
+
+
+def _tool_error(tool_name: str, e: Exception) -> str:
+    """Log a failed tool call and return the error message for the client"""
+    if isinstance(e, httpx.HTTPError):
+        logger.error("HTTP error executing tool %s: %s", tool_name, e)
+        return f"API call failed: {str(e)}"
+    logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
+    return str(e)
+
+
+@app.post(
+    "/execute",
+    response_model=ToolResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": TOOL_REQUEST_SCHEMA}}
+        }
+    }
+)
+async def execute_tool(request: Request):
+    """Execute a specific MCP tool"""
+    try:
+        tool_request = msgspec.json.decode(await request.body(), type=ToolRequest)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {e}")
     
     try:
-        logger.info(f"Executing tool: {tool_name} with endpoint: {endpoint}")
-        result = await call_vedastro_api(endpoint, request.arguments)
-        
-        return ToolResponse(
-            success=True,
-            data=result
-        )
-        
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error executing tool {tool_name}: {e}")
-        return ToolResponse(
-            success=False,
-            error=f"API call failed: {str(e)}"
-        )
+        result = await _dispatch(tool_request.tool_name, tool_request.arguments)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
         return ToolResponse(
             success=False,
-            error=str(e)
+            error=_tool_error(tool_request.tool_name, e)
         )
+    
+    # Returned as a ready Response so FastAPI doesn't re-validate and walk
+    # the whole upstream payload against response_model
+    return ORJSONResponse({"success": True, "data": result, "error": None})
+
+
+# Convenience endpoints for direct tool access: path -> (tool name, description)
+DIRECT_ROUTES = {
+    "/birth-chart": ("get_birth_chart", "birth chart"),
+    "/today": ("get_today_prediction", "today's prediction"),
+    "/weekly": ("get_weekly_prediction", "weekly prediction"),
+    "/monthly": ("get_monthly_prediction", "monthly prediction"),
+    "/yearly": ("get_yearly_prediction", "yearly prediction"),
+    "/love": ("get_love_prediction", "love prediction"),
+    "/career": ("get_career_prediction", "career prediction"),
+    "/wealth": ("get_wealth_prediction", "wealth prediction"),
+    "/health": ("get_health_prediction", "health prediction"),
+    "/wildcard": ("get_wildcard_prediction", "wildcard prediction"),
+    "/lottery": ("predict_lottery_numbers", "lottery prediction"),
+    "/lottery-all": ("predict_all_lotteries", "all lottery predictions"),
+}
+
+
+def _make_direct_handler(tool_name: str, description: str):
+    """Build a POST handler that runs one tool and returns its raw result"""
+    async def handler(data: Dict[str, Any]):
+        try:
+            if _cache_ttl(tool_name):
+                return await _dispatch(tool_name, data)
+            # Uncached results don't need decoding here, so pass the body through
+            endpoint = ENDPOINT_MAP[tool_name]
+            logger.info("Streaming tool: %s from endpoint: %s", tool_name, endpoint)
+            return await stream_vedastro_api(endpoint, data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=_tool_error(tool_name, e))
+    
+    handler.__doc__ = f"Direct endpoint for {description}"
+    return handler
 
 
-# Convenience endpoints for direct tool access
-@app.post("/birth-chart")
-async def get_birth_chart(data: Dict[str, Any]):
-    """Direct endpoint for birth chart"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_birth_chart",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/today")
-async def get_today(data: Dict[str, Any]):
-    """Direct endpoint for today's prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_today_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/weekly")
-async def get_weekly(data: Dict[str, Any]):
-    """Direct endpoint for weekly prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_weekly_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/monthly")
-async def get_monthly(data: Dict[str, Any]):
-    """Direct endpoint for monthly prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_monthly_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/yearly")
-async def get_yearly(data: Dict[str, Any]):
-    """Direct endpoint for yearly prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_yearly_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/love")
-async def get_love(data: Dict[str, Any]):
-    """Direct endpoint for love prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_love_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/career")
-async def get_career(data: Dict[str, Any]):
-    """Direct endpoint for career prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_career_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/wealth")
-async def get_wealth(data: Dict[str, Any]):
-    """Direct endpoint for wealth prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_wealth_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/health")
-async def get_health(data: Dict[str, Any]):
-    """Direct endpoint for health prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_health_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/wildcard")
-async def get_wildcard(data: Dict[str, Any]):
-    """Direct endpoint for wildcard prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="get_wildcard_prediction",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
+for _path, (_tool_name, _description) in DIRECT_ROUTES.items():
+    app.add_api_route(
+        _path,
+        _make_direct_handler(_tool_name, _description),
+        methods=["POST"],
+        name=_tool_name
+    )
+
 
 @app.get("/lottery-types")
 async def get_lottery_types_mcp():
     """Direct endpoint for lottery types"""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(f"{VEDASTRO_API_URL}/lottery/types")
-        return response.json()
-
-
-@app.post("/lottery")
-async def predict_lottery_mcp(data: Dict[str, Any]):
-    """Direct endpoint for lottery prediction"""
-    result = await execute_tool(ToolRequest(
-        tool_name="predict_lottery_numbers",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
-
-
-@app.post("/lottery-all")
-async def predict_all_lotteries_mcp(data: Dict[str, Any]):
-    """Direct endpoint for all lottery predictions"""
-    result = await execute_tool(ToolRequest(
-        tool_name="predict_all_lotteries",
-        arguments=data
-    ))
-    if not result.success:
-        raise HTTPException(status_code=500, detail=result.error)
-    return result.data
+    response = await app.state.http.get("/lottery/types", timeout=10.0)
+    return orjson.loads(response.content)
+
+
+# Build the OpenAPI schema once all routes are registered and serve the
+# serialized bytes in place of FastAPI's per-request /openapi.json handler
+_OPENAPI_JSON = orjson.dumps(app.openapi())
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json():
+    """Pre-built OpenAPI schema"""
+    return Response(content=_OPENAPI_JSON, media_type="application/json")
+
 
 if __name__ == "__main__":
     logger.info(f"Starting Vedic Astrology MCP Server on port {MCP_PORT}")
     logger.info(f"Connecting to Vedastro API at: {VEDASTRO_API_URL}")
     logger.info(f"Access documentation at: http://localhost:{MCP_PORT}/docs")
     
+    # Workers need an import string rather than the app object
     uvicorn.run(
-        app,
+        "mcp_server:app",
         host="0.0.0.0",
         port=MCP_PORT,
+        workers=MCP_WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file
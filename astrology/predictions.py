@@ -4,36 +4,121 @@ Generate monthly predictions for next 12 months
 Based on transits, dashas, and natal chart positions
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
-from local_calculate import LocalCalculate, PlanetName, ZODIAC_SIGNS, calculate_chart
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple, Any
+from local_calculate import (
+    LocalCalculate, PlanetName, ZODIAC_SIGNS, NAKSHATRAS, PLANET_IDS, calculate_chart
+)
 import calendar
+import copy
+import heapq
+import math
 import re
+import threading
+
+import numpy as np
+
+# Planets analyzed month by month in transit predictions
+TRANSIT_PLANETS = [PlanetName.JUPITER, PlanetName.SATURN, PlanetName.MARS,
+                   PlanetName.VENUS, PlanetName.MERCURY, PlanetName.SUN, PlanetName.MOON]
+
+# Planets reported for a wildcard event date (PLANET_IDS order)
+EVENT_PLANETS = tuple(PLANET_IDS)
+
+# Name lookup arrays for vectorized sign/nakshatra classification
+_ZODIAC_SIGN_NAMES = np.array(ZODIAC_SIGNS)
+_NAKSHATRA_NAMES = np.array(NAKSHATRAS)
+
+# Zodiac sign name -> index (0 = Aries)
+_SIGN_INDEX = {sign: sign_index for sign_index, sign in enumerate(ZODIAC_SIGNS)}
+
+# Common date patterns
+_DATE_PATTERNS = [re.compile(p) for p in (
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY or DD-MM-YYYY
+    r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
+    r'(\w+)\s+(\d{1,2}),?\s+(\d{4})',      # Month DD, YYYY
+    r'(\d{1,2})\s+(\w+)\s+(\d{4})',        # DD Month YYYY
+    r'(\d{1,2})(?:st|nd|rd|th)?\s+of\s+(\w+)\s+(\d{4})',  # DDth of Month YYYY
+)]
+
+# Transit effect codes, with their display names and area scores
+EFFECT_POSITIVE, EFFECT_MIXED, EFFECT_NEUTRAL, EFFECT_CHALLENGING = 0, 1, 2, 3
+_EFFECT_NAMES = ("positive", "mixed", "neutral", "challenging")
+_EFFECT_SCORE = (2, 0, 0, -2)
+
+# Benefic (kendra/trikona/gain), malefic (dusthana) and neutral (3rd) houses as bitmasks
+_BENEFIC_MASK = (1 << 1) | (1 << 2) | (1 << 4) | (1 << 5) | (1 << 7) | (1 << 9) | (1 << 10) | (1 << 11)
+_MALEFIC_MASK = (1 << 6) | (1 << 8) | (1 << 12)
+_NEUTRAL_MASK = 1 << 3
+
+# Planets checked when scoring a single date for an area
+_DATE_QUALITY_PLANETS = {
+    "love": ("Venus", "Moon"),
+    "career": ("Sun", "Saturn"),
+    "wealth": ("Jupiter", "Mercury"),
+    "health": ("Sun", "Moon"),
+}
+
+# Natural benefics and malefics for transit effects
+_BENEFIC_PLANETS = frozenset({PlanetName.JUPITER, PlanetName.VENUS, PlanetName.MERCURY})
+_MALEFIC_PLANETS = frozenset({PlanetName.SATURN, PlanetName.MARS, PlanetName.RAHU, PlanetName.KETU})
+
+# Transit description templates
+_TMPL_POSITIVE = "{planet} transiting {house}th house brings {pos2} related to {area}."
+_TMPL_MIXED_IN_BENEFIC_HOUSE = "{planet} in {house}th house requires careful handling of {area}."
+_TMPL_CHALLENGING = "{planet} in {house}th house may bring {neg2} affecting {area}."
+_TMPL_MIXED_IN_DUSTHANA = "{planet} transiting {house}th house provides support despite challenges in {area}."
+
+# Life areas ruled by each house (a house can feed several areas)
+_HOUSE_AREAS = {
+    5: ("love",), 7: ("love",), 11: ("love", "wealth"),
+    2: ("wealth",),
+    1: ("health",), 6: ("health", "career"),
+    10: ("career",),
+}
+
+# Planets relevant to each life area
+_AREA_PLANETS = {
+    "love": ("Venus", "Moon", "Jupiter", "Mars"),
+    "career": ("Sun", "Saturn", "Jupiter", "Mercury"),
+    "wealth": ("Jupiter", "Venus", "Mercury", "Moon"),
+    "health": ("Sun", "Moon", "Mars", "Saturn"),
+}
+
+# Query keywords that pick the wildcard area, checked in order (substring matches)
+_AREA_PATTERNS = [
+    (area, concern_type, re.compile("|".join(map(re.escape, keywords))))
+    for area, concern_type, keywords in (
+        ("love", "romance", ("date", "love", "romance", "relationship", "marry", "propose", "lucky")),
+        ("career", "professional", ("job", "interview", "promotion", "career", "work", "redundancy", "fired")),
+        ("wealth", "financial", ("money", "investment", "business", "financial", "buy", "purchase", "contract")),
+        ("health", "safety", ("health", "safe", "safety", "accident", "motorcycle", "surgery", "medical")),
+    )
+]
+
+_MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Day names indexed by datetime.weekday() (Monday=0)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 
 def extract_date_from_query(query: str) -> str:
     """Extract date from natural language query"""
-    # Common date patterns
-    patterns = [
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY or DD-MM-YYYY
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
-        r'(\w+)\s+(\d{1,2}),?\s+(\d{4})',      # Month DD, YYYY
-        r'(\d{1,2})\s+(\w+)\s+(\d{4})',        # DD Month YYYY
-        r'(\d{1,2})(?:st|nd|rd|th)?\s+of\s+(\w+)\s+(\d{4})',  # DDth of Month YYYY
-    ]
-    
-    month_names = {
-        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-        'september': 9, 'october': 10, 'november': 11, 'december': 12,
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
-        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-    }
-    
     query_lower = query.lower()
     
-    for pattern in patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             groups = match.groups()
             try:
@@ -49,7 +134,7 @@ def extract_date_from_query(query: str) -> str:
                 day = groups[1] if groups[0].isdigit() else groups[0]
                 year = groups[2]
                 
-                month = month_names.get(month_str.lower())
+                month = _MONTH_NAMES.get(month_str.lower())
                 if month:
                     return f"{year}-{month:02d}-{int(day):02d}"
             except (ValueError, IndexError):
@@ -57,93 +142,178 @@ def extract_date_from_query(query: str) -> str:
     
     return None
 
+def _month_starts(start_date: datetime, end_date: datetime) -> List[datetime]:
+    """First instant of every month in the range, beginning at start_date itself"""
+    month_dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        month_dates.append(current_date)
+        current_date = (current_date.replace(day=28) + timedelta(days=4)).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+    return month_dates
+
+
+def _describe_transit(planet: str, house: int, pos2: str, neg2: str, area: str) -> Tuple[int, str]:
+    """Classify a planet's transit through a house and render its description"""
+    fields = {"planet": planet, "house": house, "pos2": pos2, "neg2": neg2, "area": area}
+    
+    if _BENEFIC_MASK >> house & 1:
+        if planet in _BENEFIC_PLANETS:
+            return EFFECT_POSITIVE, _TMPL_POSITIVE.format_map(fields)
+        return EFFECT_MIXED, _TMPL_MIXED_IN_BENEFIC_HOUSE.format_map(fields)
+    if _MALEFIC_MASK >> house & 1:
+        if planet in _MALEFIC_PLANETS:
+            return EFFECT_CHALLENGING, _TMPL_CHALLENGING.format_map(fields)
+        return EFFECT_MIXED, _TMPL_MIXED_IN_DUSTHANA.format_map(fields)
+    return EFFECT_NEUTRAL, ""
+
+
+def _build_transit_effects(planet_top: Dict, house_areas: Tuple[str, ...]) -> Dict:
+    """Pre-render _describe_transit for every known planet and house"""
+    return {
+        (planet, house): _describe_transit(planet, house, top["pos2"], top["neg2"], house_areas[house])
+        for planet, top in planet_top.items()
+        for house in range(1, 13)
+    }
+
+
+# House significations
+_HOUSE_MEANINGS = MappingProxyType({
+    1: {"area": "Self, Health, Personality", "keywords": ["identity", "vitality", "appearance", "new beginnings"]},
+    2: {"area": "Wealth, Family, Speech", "keywords": ["money", "savings", "family", "values", "food"]},
+    3: {"area": "Courage, Siblings, Communication", "keywords": ["efforts", "short travels", "skills", "siblings"]},
+    4: {"area": "Home, Mother, Property", "keywords": ["home", "comfort", "emotions", "real estate", "mother"]},
+    5: {"area": "Children, Romance, Creativity", "keywords": ["love", "children", "speculation", "education", "creativity"]},
+    6: {"area": "Health Issues, Enemies, Service", "keywords": ["obstacles", "competition", "health problems", "debts"]},
+    7: {"area": "Marriage, Partnerships, Business", "keywords": ["spouse", "partnerships", "contracts", "business"]},
+    8: {"area": "Longevity, Transformation, Hidden", "keywords": ["transformation", "inheritance", "mysteries", "research"]},
+    9: {"area": "Fortune, Father, Spirituality", "keywords": ["luck", "higher learning", "travel", "dharma", "father"]},
+    10: {"area": "Career, Status, Authority", "keywords": ["profession", "reputation", "authority", "achievements"]},
+    11: {"area": "Gains, Friends, Aspirations", "keywords": ["income", "gains", "friends", "ambitions", "network"]},
+    12: {"area": "Expenses, Foreign, Spirituality", "keywords": ["losses", "foreign lands", "spirituality", "isolation"]}
+})
+
+# Planet effects
+_PLANET_EFFECTS = MappingProxyType({
+    PlanetName.SUN: {
+        "positive": ["confidence", "authority", "recognition", "vitality", "leadership"],
+        "negative": ["ego conflicts", "authority issues", "health concerns", "father issues"],
+        "areas": ["career", "father", "health", "government", "authority"]
+    },
+    PlanetName.MOON: {
+        "positive": ["emotional stability", "mental peace", "intuition", "popularity", "comfort"],
+        "negative": ["mood swings", "anxiety", "emotional instability", "mother issues"],
+        "areas": ["emotions", "mind", "mother", "home", "public"]
+    },
+    PlanetName.MARS: {
+        "positive": ["energy", "courage", "success in competition", "property gains", "siblings support"],
+        "negative": ["conflicts", "accidents", "aggression", "impulsiveness", "legal issues"],
+        "areas": ["energy", "property", "siblings", "courage", "competition"]
+    },
+    PlanetName.MERCURY: {
+        "positive": ["intelligence", "communication skills", "business success", "learning", "writing"],
+        "negative": ["confusion", "communication problems", "indecision", "nervous tension"],
+        "areas": ["communication", "business", "intellect", "trade", "education"]
+    },
+    PlanetName.JUPITER: {
+        "positive": ["wisdom", "growth", "fortune", "spiritual progress", "wealth", "children"],
+        "negative": ["overconfidence", "excess", "legal issues", "weight gain"],
+        "areas": ["wisdom", "wealth", "children", "education", "spirituality"]
+    },
+    PlanetName.VENUS: {
+        "positive": ["love", "luxury", "artistic success", "relationships", "comforts", "marriage"],
+        "negative": ["relationship issues", "overindulgence", "financial extravagance"],
+        "areas": ["love", "marriage", "luxury", "arts", "beauty", "vehicles"]
+    },
+    PlanetName.SATURN: {
+        "positive": ["discipline", "hard work rewards", "stability", "longevity", "career growth"],
+        "negative": ["delays", "restrictions", "hard work", "obstacles", "depression", "losses"],
+        "areas": ["career", "discipline", "delays", "longevity", "servants"]
+    },
+    PlanetName.RAHU: {
+        "positive": ["sudden gains", "foreign opportunities", "innovation", "unconventional success"],
+        "negative": ["confusion", "deception", "obsession", "scandals", "addictions"],
+        "areas": ["foreign", "technology", "sudden events", "materialism"]
+    },
+    PlanetName.KETU: {
+        "positive": ["spirituality", "liberation", "past karma resolution", "occult knowledge"],
+        "negative": ["losses", "detachment", "confusion", "accidents", "mysterious problems"],
+        "areas": ["spirituality", "detachment", "past life", "occult", "moksha"]
+    }
+})
+
+# House area names indexed directly by house number (index 0 unused)
+_HOUSE_AREA_NAMES = ("",) + tuple(meaning["area"] for _, meaning in sorted(_HOUSE_MEANINGS.items()))
+
+# Top-2 effect phrases pre-joined for transit descriptions
+_PLANET_TOP = MappingProxyType({
+    planet: {
+        "pos2": ", ".join(effects["positive"][:2]),
+        "neg2": ", ".join(effects["negative"][:2]),
+        "areas": tuple(effects["areas"])
+    }
+    for planet, effects in _PLANET_EFFECTS.items()
+})
+
+# (effect code, description) for every planet/house pair, rendered once
+_TRANSIT_EFFECTS = _build_transit_effects(_PLANET_TOP, _HOUSE_AREA_NAMES)
+
+
 class PredictionEngine:
     """Generate astrological predictions"""
     
-    # House significations
-    HOUSE_MEANINGS = {
-        1: {"area": "Self, Health, Personality", "keywords": ["identity", "vitality", "appearance", "new beginnings"]},
-        2: {"area": "Wealth, Family, Speech", "keywords": ["money", "savings", "family", "values", "food"]},
-        3: {"area": "Courage, Siblings, Communication", "keywords": ["efforts", "short travels", "skills", "siblings"]},
-        4: {"area": "Home, Mother, Property", "keywords": ["home", "comfort", "emotions", "real estate", "mother"]},
-        5: {"area": "Children, Romance, Creativity", "keywords": ["love", "children", "speculation", "education", "creativity"]},
-        6: {"area": "Health Issues, Enemies, Service", "keywords": ["obstacles", "competition", "health problems", "debts"]},
-        7: {"area": "Marriage, Partnerships, Business", "keywords": ["spouse", "partnerships", "contracts", "business"]},
-        8: {"area": "Longevity, Transformation, Hidden", "keywords": ["transformation", "inheritance", "mysteries", "research"]},
-        9: {"area": "Fortune, Father, Spirituality", "keywords": ["luck", "higher learning", "travel", "dharma", "father"]},
-        10: {"area": "Career, Status, Authority", "keywords": ["profession", "reputation", "authority", "achievements"]},
-        11: {"area": "Gains, Friends, Aspirations", "keywords": ["income", "gains", "friends", "ambitions", "network"]},
-        12: {"area": "Expenses, Foreign, Spirituality", "keywords": ["losses", "foreign lands", "spirituality", "isolation"]}
-    }
-    
-    # Planet effects
-    PLANET_EFFECTS = {
-        PlanetName.SUN: {
-            "positive": ["confidence", "authority", "recognition", "vitality", "leadership"],
-            "negative": ["ego conflicts", "authority issues", "health concerns", "father issues"],
-            "areas": ["career", "father", "health", "government", "authority"]
-        },
-        PlanetName.MOON: {
-            "positive": ["emotional stability", "mental peace", "intuition", "popularity", "comfort"],
-            "negative": ["mood swings", "anxiety", "emotional instability", "mother issues"],
-            "areas": ["emotions", "mind", "mother", "home", "public"]
-        },
-        PlanetName.MARS: {
-            "positive": ["energy", "courage", "success in competition", "property gains", "siblings support"],
-            "negative": ["conflicts", "accidents", "aggression", "impulsiveness", "legal issues"],
-            "areas": ["energy", "property", "siblings", "courage", "competition"]
-        },
-        PlanetName.MERCURY: {
-            "positive": ["intelligence", "communication skills", "business success", "learning", "writing"],
-            "negative": ["confusion", "communication problems", "indecision", "nervous tension"],
-            "areas": ["communication", "business", "intellect", "trade", "education"]
-        },
-        PlanetName.JUPITER: {
-            "positive": ["wisdom", "growth", "fortune", "spiritual progress", "wealth", "children"],
-            "negative": ["overconfidence", "excess", "legal issues", "weight gain"],
-            "areas": ["wisdom", "wealth", "children", "education", "spirituality"]
-        },
-        PlanetName.VENUS: {
-            "positive": ["love", "luxury", "artistic success", "relationships", "comforts", "marriage"],
-            "negative": ["relationship issues", "overindulgence", "financial extravagance"],
-            "areas": ["love", "marriage", "luxury", "arts", "beauty", "vehicles"]
-        },
-        PlanetName.SATURN: {
-            "positive": ["discipline", "hard work rewards", "stability", "longevity", "career growth"],
-            "negative": ["delays", "restrictions", "hard work", "obstacles", "depression", "losses"],
-            "areas": ["career", "discipline", "delays", "longevity", "servants"]
-        },
-        PlanetName.RAHU: {
-            "positive": ["sudden gains", "foreign opportunities", "innovation", "unconventional success"],
-            "negative": ["confusion", "deception", "obsession", "scandals", "addictions"],
-            "areas": ["foreign", "technology", "sudden events", "materialism"]
-        },
-        PlanetName.KETU: {
-            "positive": ["spirituality", "liberation", "past karma resolution", "occult knowledge"],
-            "negative": ["losses", "detachment", "confusion", "accidents", "mysterious problems"],
-            "areas": ["spirituality", "detachment", "past life", "occult", "moksha"]
-        }
-    }
+    # House significations and planet effects (read-only, shared with module helpers)
+    HOUSE_MEANINGS = _HOUSE_MEANINGS
+    PLANET_EFFECTS = _PLANET_EFFECTS
     
     @staticmethod
     def get_transit_predictions(natal_chart: Dict, start_date: datetime, 
-                                end_date: datetime, lat: float, lon: float) -> List[Dict]:
-        """Generate predictions based on planetary transits"""
+                                end_date: datetime, lat: float, lon: float,
+                                area: str = None, cusps_cache: Dict = None) -> List[Dict]:
+        """Generate predictions based on planetary transits (only `area` is scored when given)"""
+        return list(PredictionEngine.iter_transit_predictions(
+            natal_chart, start_date, end_date, lat, lon, area, cusps_cache
+        ))
+    
+    @staticmethod
+    def iter_transit_predictions(natal_chart: Dict, start_date: datetime, 
+                                 end_date: datetime, lat: float, lon: float,
+                                 area: str = None, cusps_cache: Dict = None) -> Iterator[Dict]:
+        """Yield monthly transit predictions one month at a time"""
         
-        predictions = []
-        current_date = start_date
+        month_dates = _month_starts(start_date, end_date)
+        month_names = [d.strftime("%B %Y") for d in month_dates]
+        range_starts = [d.strftime("%Y-%m-%d") for d in month_dates]
+        range_ends = [(d + timedelta(days=30)).strftime("%Y-%m-%d") for d in month_dates]
         
-        while current_date <= end_date:
-            # Calculate transit positions for this date
-            jd = LocalCalculate.get_julian_day(current_date)
-            ayanamsa = LocalCalculate.get_ayanamsa(jd)
-            house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
-            
+        if not month_dates:
+            return
+        
+        # Compute every month's transit positions in one batch
+        jds = np.array([LocalCalculate.get_julian_day(d) for d in month_dates])
+        ayanamsas = np.array([LocalCalculate.get_ayanamsa(jd) for jd in jds])
+        cusps = np.array([
+            LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
+            for jd, ayanamsa in zip(jds, ayanamsas)
+        ])
+        longitudes = LocalCalculate.get_planet_longitudes_batch(TRANSIT_PLANETS, jds, ayanamsas)
+        houses = LocalCalculate.get_planet_houses_batch(longitudes, cusps).tolist()
+        signs = (np.floor(longitudes / 30).astype(int) % 12).tolist()
+        
+        # Hand the monthly cusps to callers that sample dates inside these months
+        if cusps_cache is not None:
+            for jd, month_cusps in zip(jds, cusps):
+                cusps_cache[round(float(jd), 6)] = tuple(month_cusps.tolist())
+        
+        area_planets = _AREA_PLANETS.get(area, ()) if area else None
+        
+        for month_index in range(len(month_dates)):
             month_predictions = {
-                "month": current_date.strftime("%B %Y"),
+                "month": month_names[month_index],
                 "date_range": {
-                    "start": current_date.strftime("%Y-%m-%d"),
-                    "end": (current_date + timedelta(days=30)).strftime("%Y-%m-%d")
+                    "start": range_starts[month_index],
+                    "end": range_ends[month_index]
                 },
                 "transits": [],
                 "key_areas": {
@@ -157,12 +327,15 @@ class PredictionEngine:
             }
             
             # Analyze each planet's transit
-            for planet_name in [PlanetName.JUPITER, PlanetName.SATURN, PlanetName.MARS,
-                              PlanetName.VENUS, PlanetName.MERCURY, PlanetName.SUN, PlanetName.MOON]:
+            for planet_index, planet_name in enumerate(TRANSIT_PLANETS):
+                
+                transit_house = houses[month_index][planet_index]
+                
+                # Skip planets that neither belong to nor score in the requested area
+                if area and planet_name not in area_planets and area not in _HOUSE_AREAS.get(transit_house, ()):
+                    continue
                 
-                transit_long = LocalCalculate.get_planet_longitude(planet_name, jd, ayanamsa)
-                transit_house = LocalCalculate.get_planet_house(transit_long, house_cusps)
-                transit_sign, _ = LocalCalculate.longitude_to_sign(transit_long)
+                transit_sign = ZODIAC_SIGNS[signs[month_index][planet_index]]
                 
                 # Get natal position
                 natal_planet = natal_chart["planets"][planet_name]
@@ -177,7 +350,7 @@ class PredictionEngine:
                     "planet": planet_name,
                     "transit_house": transit_house,
                     "transit_sign": transit_sign,
-                    "effect": transit_effect["effect"],
+                    "effect": _EFFECT_NAMES[transit_effect["effect"]],
                     "description": transit_effect["description"],
                     "areas_affected": transit_effect["areas"]
                 })
@@ -187,7 +360,8 @@ class PredictionEngine:
                     month_predictions["key_areas"], 
                     transit_effect, 
                     planet_name,
-                    transit_house
+                    transit_house,
+                    area
                 )
             
             # Calculate overall rating
@@ -200,83 +374,44 @@ class PredictionEngine:
                 month_predictions
             )
             
-            predictions.append(month_predictions)
-            
-            # Move to next month
-            next_month = current_date.month % 12 + 1
-            next_year = current_date.year + (1 if next_month == 1 else 0)
-            current_date = datetime(next_year, next_month, 1)
-        
-        return predictions
+            yield month_predictions
     
     @staticmethod
     def _analyze_transit_effect(planet: str, transit_house: int, 
                                 natal_house: int, natal_chart: Dict) -> Dict:
-        """Analyze the effect of a planet's transit"""
-        
-        planet_effects = PredictionEngine.PLANET_EFFECTS.get(planet, {})
-        house_info = PredictionEngine.HOUSE_MEANINGS.get(transit_house, {})
+        """Analyze the effect of a planet's transit ("effect" is an EFFECT_* code)"""
         
-        # Determine if transit is beneficial
-        beneficial_houses = [1, 2, 4, 5, 7, 9, 10, 11]  # Natural benefic houses
-        challenging_houses = [6, 8, 12]  # Dusthana houses
+        planet_top = _PLANET_TOP.get(planet, {"pos2": "", "neg2": "", "areas": ()})
         
-        effect = "neutral"
-        description = ""
-        
-        # Check if planet is benefic or malefic in natal chart
-        is_benefic = planet in [PlanetName.JUPITER, PlanetName.VENUS, PlanetName.MERCURY]
-        is_malefic = planet in [PlanetName.SATURN, PlanetName.MARS, PlanetName.RAHU, PlanetName.KETU]
-        
-        if transit_house in beneficial_houses:
-            if is_benefic:
-                effect = "positive"
-                description = f"{planet} transiting {transit_house}th house brings {', '.join(planet_effects.get('positive', [])[:2])} related to {house_info.get('area', '')}."
-            else:
-                effect = "mixed"
-                description = f"{planet} in {transit_house}th house requires careful handling of {house_info.get('area', '')}."
-        elif transit_house in challenging_houses:
-            if is_malefic:
-                effect = "challenging"
-                description = f"{planet} in {transit_house}th house may bring {', '.join(planet_effects.get('negative', [])[:2])} affecting {house_info.get('area', '')}."
-            else:
-                effect = "mixed"
-                description = f"{planet} transiting {transit_house}th house provides support despite challenges in {house_info.get('area', '')}."
+        effect_and_description = _TRANSIT_EFFECTS.get((planet, transit_house))
+        if effect_and_description is None:
+            effect_and_description = _describe_transit(
+                planet, transit_house, planet_top["pos2"], planet_top["neg2"],
+                _HOUSE_AREA_NAMES[transit_house]
+            )
+        effect, description = effect_and_description
         
         return {
             "effect": effect,
             "description": description,
-            "areas": planet_effects.get("areas", [])
+            "areas": planet_top["areas"]
         }
     
     @staticmethod
     def _update_area_scores(key_areas: Dict, transit_effect: Dict, 
-                           planet: str, transit_house: int):
+                           planet: str, transit_house: int, only_area: str = None):
         """Update scores for key life areas"""
         
-        effect_scores = {
-            "positive": 2,
-            "mixed": 0,
-            "neutral": 0,
-            "challenging": -2
-        }
-        
-        score = effect_scores.get(transit_effect["effect"], 0)
-        
-        # Map houses to life areas
-        house_to_area = {
-            5: "love", 7: "love", 11: "love",  # Love related
-            2: "wealth", 11: "wealth",  # Wealth related
-            1: "health", 6: "health",  # Health related
-            10: "career", 6: "career",  # Career related
-        }
+        effect_code = transit_effect["effect"]
+        score = _EFFECT_SCORE[effect_code]
         
-        if transit_house in house_to_area:
-            area = house_to_area[transit_house]
+        for area in _HOUSE_AREAS.get(transit_house, ()):
+            if only_area and area != only_area:
+                continue
             key_areas[area]["score"] += score
             key_areas[area]["events"].append({
                 "planet": planet,
-                "effect": transit_effect["effect"],
+                "effect": _EFFECT_NAMES[effect_code],
                 "description": transit_effect["description"]
             })
     
@@ -349,21 +484,27 @@ def generate_yearly_predictions(natal_chart: Dict, lat: float, lon: float) -> Di
         }
     }
     
-    # Analyze best and worst months
-    sorted_predictions = sorted(predictions, key=lambda x: x["overall_rating"], reverse=True)
+    # Analyze best and worst months (worst scanned from the end so ties match a full sort)
+    by_rating = itemgetter("overall_rating")
     yearly_overview["best_months"] = [
         {"month": p["month"], "rating": p["overall_rating"]} 
-        for p in sorted_predictions[:3]
+        for p in heapq.nlargest(3, predictions, key=by_rating)
     ]
     yearly_overview["challenging_months"] = [
         {"month": p["month"], "rating": p["overall_rating"]} 
-        for p in sorted_predictions[-3:]
+        for p in heapq.nsmallest(3, reversed(predictions), key=by_rating)[::-1]
     ]
     
+    # Sum every area's score in a single pass over the months
+    area_sums = {"love": 0, "career": 0, "wealth": 0, "health": 0}
+    for p in predictions:
+        key_areas = p["key_areas"]
+        for area in area_sums:
+            area_sums[area] += key_areas[area]["score"]
+    
     # Calculate trends for each area
-    for area in ["love", "career", "wealth", "health"]:
-        scores = [p["key_areas"][area]["score"] for p in predictions]
-        avg_score = sum(scores) / len(scores)
+    for area, area_sum in area_sums.items():
+        avg_score = area_sum / len(predictions)
         
         if avg_score > 3:
             trend = "Very positive year ahead"
@@ -418,23 +559,27 @@ def generate_area_specific_predictions(natal_chart: Dict, lat: float, lon: float
     
     end_date = start_date + timedelta(days=30 * months)
     
-    # Get general predictions
-    monthly_predictions = PredictionEngine.get_transit_predictions(
-        natal_chart, start_date, end_date, lat, lon
+    # Stream general predictions, keeping the month cusps for the best-date scan
+    cusps_cache = {}
+    monthly_predictions = PredictionEngine.iter_transit_predictions(
+        natal_chart, start_date, end_date, lat, lon, area, cusps_cache
     )
     
-    # Focus on specific area
+    # Focus on specific area (overview rows carry the pre-formatted date span)
     area_predictions = []
+    overview_rows = []
     
-    for month_data in monthly_predictions:
+    month_dates = _month_starts(start_date, end_date)
+    
+    for month_date, month_data in zip(month_dates, monthly_predictions):
         if area not in month_data["key_areas"]:
             continue
             
         area_data = month_data["key_areas"][area]
         
-        # Calculate precise date ranges
-        start_date = datetime.strptime(month_data["date_range"]["start"], "%Y-%m-%d")
-        end_date_month = datetime.strptime(month_data["date_range"]["end"], "%Y-%m-%d")
+        # Calculate precise date ranges (whole days, as in the month's date_range)
+        month_start = month_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        month_end = month_start + timedelta(days=30)
         
         # Rating from 1-10
         score = area_data["score"]
@@ -461,16 +606,25 @@ def generate_area_specific_predictions(natal_chart: Dict, lat: float, lon: float
         remedies = _get_remedies_for_area(area, rating, relevant_transits)
         
         # Best dates in the month
-        best_dates = _calculate_best_dates_in_month(start_date, end_date_month, 
-                                                    natal_chart, lat, lon, area)
+        best_dates = _calculate_best_dates_in_month(month_start, month_end, 
+                                                    natal_chart, lat, lon, area, cusps_cache)
+        
+        start_str = month_start.strftime("%Y-%m-%d")
+        end_str = month_end.strftime("%Y-%m-%d")
+        
+        overview_rows.append({
+            "month": month_data["month"],
+            "rating": rating,
+            "dates": f"{start_str} to {end_str}"
+        })
         
         area_predictions.append({
             "month": month_data["month"],
             "date_range": {
-                "start": start_date.strftime("%Y-%m-%d"),
-                "end": end_date_month.strftime("%Y-%m-%d"),
-                "start_day": start_date.strftime("%A, %B %d, %Y"),
-                "end_day": end_date_month.strftime("%A, %B %d, %Y")
+                "start": start_str,
+                "end": end_str,
+                "start_day": month_start.strftime("%A, %B %d, %Y"),
+                "end_day": month_end.strftime("%A, %B %d, %Y")
             },
             "rating": rating,
             "quality": quality,
@@ -484,7 +638,7 @@ def generate_area_specific_predictions(natal_chart: Dict, lat: float, lon: float
         })
     
     # Create overview
-    overview = _create_area_overview(area_predictions, area)
+    overview = _create_area_overview(overview_rows, area)
     
     # Calculate prediction period from actual predictions
     if area_predictions:
@@ -511,17 +665,9 @@ def generate_area_specific_predictions(natal_chart: Dict, lat: float, lon: float
 def _get_area_relevant_transits(transits: List[Dict], area: str) -> List[Dict]:
     """Get transits relevant to specific area"""
     
-    # Map areas to relevant planets
-    area_planets = {
-        "love": ["Venus", "Moon", "Jupiter", "Mars"],
-        "career": ["Sun", "Saturn", "Jupiter", "Mercury"],
-        "wealth": ["Jupiter", "Venus", "Mercury", "Moon"],
-        "health": ["Sun", "Moon", "Mars", "Saturn"]
-    }
-    
     relevant = []
     for transit in transits:
-        if transit["planet"] in area_planets.get(area, []):
+        if transit["planet"] in _AREA_PLANETS.get(area, ()):
             relevant.append({
                 "planet": transit["planet"],
                 "sign": transit["transit_sign"],
@@ -592,32 +738,40 @@ def _get_remedies_for_area(area: str, rating: int, transits: List[Dict]) -> List
 
 def _calculate_best_dates_in_month(start_date: datetime, end_date: datetime,
                                    natal_chart: Dict, lat: float, lon: float,
-                                   area: str) -> List[Dict]:
+                                   area: str, cusps_cache: Dict = None) -> List[Dict]:
     """Calculate best dates in a month for specific area"""
     
-    best_dates = []
-    current = start_date
+    if cusps_cache is None:
+        cusps_cache = {}
     
-    # Sample 5 dates throughout the month
-    date_interval = (end_date - start_date).days // 5
+    # Sample 5 evenly spaced dates, including both ends of the range
+    offsets = np.unique(np.linspace(0, (end_date - start_date).days, 5).astype(int)).tolist()
+    check_dates = [start_date + timedelta(days=offset) for offset in offsets]
     
-    for i in range(5):
-        check_date = current + timedelta(days=i * date_interval)
-        if check_date > end_date:
-            break
-            
-        jd = LocalCalculate.get_julian_day(check_date)
-        ayanamsa = LocalCalculate.get_ayanamsa(jd)
-        
-        # Get Moon position (important for daily muhurta)
-        moon_long = LocalCalculate.get_planet_longitude("Moon", jd, ayanamsa)
-        moon_sign, _ = LocalCalculate.longitude_to_sign(moon_long)
-        moon_nakshatra, _ = LocalCalculate.get_nakshatra(moon_long)
-        
-        # Calculate quality score
-        quality_score = _calculate_date_quality(check_date, natal_chart, lat, lon, area)
+    jds = np.array([LocalCalculate.get_julian_day(d) for d in check_dates])
+    ayanamsas = np.array([LocalCalculate.get_ayanamsa(jd) for jd in jds])
+    
+    house_cusps = []
+    for jd, ayanamsa in zip(jds.tolist(), ayanamsas.tolist()):
+        jd_key = round(jd, 6)
+        cusps = cusps_cache.get(jd_key)
+        if cusps is None:
+            cusps = tuple(LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa))
+            cusps_cache[jd_key] = cusps
+        house_cusps.append(cusps)
+    
+    # Moon position (important for daily muhurta) plus the planets scored for the area
+    planets = (PlanetName.MOON,) + _DATE_QUALITY_PLANETS.get(area, ())
+    longitudes = LocalCalculate.get_planet_longitudes_batch(planets, jds, ayanamsas)
+    houses = LocalCalculate.get_planet_houses_batch(longitudes[:, 1:], np.array(house_cusps))
+    
+    best_dates = []
+    for check_date, moon_long, planet_houses in zip(check_dates, longitudes[:, 0].tolist(), houses.tolist()):
+        quality_score = _score_houses(planet_houses)
         
         if quality_score >= 6:
+            moon_sign = ZODIAC_SIGNS[int(moon_long / 30)]
+            moon_nakshatra = NAKSHATRAS[int(moon_long / 13.333333)]
             best_dates.append({
                 "date": check_date.strftime("%Y-%m-%d"),
                 "day": check_date.strftime("%A"),
@@ -628,135 +782,143 @@ def _calculate_best_dates_in_month(start_date: datetime, end_date: datetime,
                 "recommendation": "Favorable day for important activities" if quality_score >= 8 else "Good day for moderate activities"
             })
     
-    return sorted(best_dates, key=lambda x: x["quality_score"], reverse=True)[:3]
+    return heapq.nlargest(3, best_dates, key=itemgetter("quality_score"))
 
 
-def _calculate_date_quality(date: datetime, natal_chart: Dict, lat: float, 
-                            lon: float, area: str) -> int:
-    """Calculate quality score for a specific date (1-10)"""
-    
-    jd = LocalCalculate.get_julian_day(date)
-    ayanamsa = LocalCalculate.get_ayanamsa(jd)
-    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
-    
-    score = 5  # Base score
-    
-    # Check relevant planets for the area
-    area_planets = {
-        "love": ["Venus", "Moon"],
-        "career": ["Sun", "Saturn"],
-        "wealth": ["Jupiter", "Mercury"],
-        "health": ["Sun", "Moon"]
-    }
-    
-    for planet in area_planets.get(area, []):
-        planet_long = LocalCalculate.get_planet_longitude(planet, jd, ayanamsa)
-        planet_house = LocalCalculate.get_planet_house(planet_long, house_cusps)
-        
-        # Benefic houses increase score
-        if planet_house in [1, 2, 4, 5, 7, 9, 10, 11]:
-            score += 1
-        # Malefic houses decrease score
-        elif planet_house in [6, 8, 12]:
-            score -= 1
-    
+def _score_houses(planet_houses: List[int]) -> int:
+    """Score houses from a base of 5: +1 per benefic, -1 per malefic, clamped to 1-10"""
+    score = 5
+    for house in planet_houses:
+        score += (_BENEFIC_MASK >> house) & 1
+        score -= (_MALEFIC_MASK >> house) & 1
     return max(1, min(10, score))
 
 
+# Recommended actions per area and rating level
+_AREA_ACTIONS = {
+    "love": {
+        "high": [
+            "Express your feelings openly",
+            "Plan romantic dates or getaways",
+            "Propose or take relationship to next level",
+            "Meet potential partners through social events",
+            "Strengthen existing relationships"
+        ],
+        "medium": [
+            "Focus on communication with partner",
+            "Spend quality time together",
+            "Work on resolving minor issues",
+            "Be patient and understanding"
+        ],
+        "low": [
+            "Focus on self-love and self-care",
+            "Avoid major relationship decisions",
+            "Work on personal development",
+            "Give space in relationships"
+        ]
+    },
+    "career": {
+        "high": [
+            "Ask for promotion or raise",
+            "Start new projects or ventures",
+            "Network actively with industry leaders",
+            "Apply for dream jobs",
+            "Launch new business initiatives"
+        ],
+        "medium": [
+            "Focus on current responsibilities",
+            "Build professional relationships",
+            "Upgrade skills through training",
+            "Maintain steady work pace"
+        ],
+        "low": [
+            "Avoid confrontations with bosses",
+            "Focus on completing existing tasks",
+            "Don't make major career changes",
+            "Build skills for future opportunities"
+        ]
+    },
+    "wealth": {
+        "high": [
+            "Make calculated investments",
+            "Start new income streams",
+            "Negotiate better deals",
+            "Purchase assets or property",
+            "Expand business operations"
+        ],
+        "medium": [
+            "Focus on savings and budgeting",
+            "Pay off existing debts",
+            "Research investment opportunities",
+            "Maintain financial discipline"
+        ],
+        "low": [
+            "Avoid major financial commitments",
+            "Focus on expense reduction",
+            "Don't take unnecessary loans",
+            "Postpone big purchases",
+            "Build emergency fund"
+        ]
+    },
+    "health": {
+        "high": [
+            "Start new fitness regime",
+            "Schedule elective medical procedures",
+            "Begin new health practices",
+            "Join gym or sports activities",
+            "Focus on preventive health"
+        ],
+        "medium": [
+            "Maintain current health routines",
+            "Get regular health checkups",
+            "Practice stress management",
+            "Focus on balanced diet"
+        ],
+        "low": [
+            "Avoid strenuous physical activities",
+            "Postpone elective surgeries",
+            "Rest and recover properly",
+            "Consult doctors for any concerns",
+            "Focus on gentle exercises only"
+        ]
+    }
+}
+
+
 def _get_action_items(area: str, rating: int) -> List[str]:
     """Get recommended actions based on area and rating"""
     
-    actions = {
-        "love": {
-            "high": [
-                "Express your feelings openly",
-                "Plan romantic dates or getaways",
-                "Propose or take relationship to next level",
-                "Meet potential partners through social events",
-                "Strengthen existing relationships"
-            ],
-            "medium": [
-                "Focus on communication with partner",
-                "Spend quality time together",
-                "Work on resolving minor issues",
-                "Be patient and understanding"
-            ],
-            "low": [
-                "Focus on self-love and self-care",
-                "Avoid major relationship decisions",
-                "Work on personal development",
-                "Give space in relationships"
-            ]
-        },
-        "career": {
-            "high": [
-                "Ask for promotion or raise",
-                "Start new projects or ventures",
-                "Network actively with industry leaders",
-                "Apply for dream jobs",
-                "Launch new business initiatives"
-            ],
-            "medium": [
-                "Focus on current responsibilities",
-                "Build professional relationships",
-                "Upgrade skills through training",
-                "Maintain steady work pace"
-            ],
-            "low": [
-                "Avoid confrontations with bosses",
-                "Focus on completing existing tasks",
-                "Don't make major career changes",
-                "Build skills for future opportunities"
-            ]
-        },
-        "wealth": {
-            "high": [
-                "Make calculated investments",
-                "Start new income streams",
-                "Negotiate better deals",
-                "Purchase assets or property",
-                "Expand business operations"
-            ],
-            "medium": [
-                "Focus on savings and budgeting",
-                "Pay off existing debts",
-                "Research investment opportunities",
-                "Maintain financial discipline"
-            ],
-            "low": [
-                "Avoid major financial commitments",
-                "Focus on expense reduction",
-                "Don't take unnecessary loans",
-                "Postpone big purchases",
-                "Build emergency fund"
-            ]
-        },
-        "health": {
-            "high": [
-                "Start new fitness regime",
-                "Schedule elective medical procedures",
-                "Begin new health practices",
-                "Join gym or sports activities",
-                "Focus on preventive health"
-            ],
-            "medium": [
-                "Maintain current health routines",
-                "Get regular health checkups",
-                "Practice stress management",
-                "Focus on balanced diet"
-            ],
-            "low": [
-                "Avoid strenuous physical activities",
-                "Postpone elective surgeries",
-                "Rest and recover properly",
-                "Consult doctors for any concerns",
-                "Focus on gentle exercises only"
-            ]
-        }
-    }
-    
     level = "high" if rating >= 7 else "medium" if rating >= 4 else "low"
-    return actions.get(area, {}).get(level, [])[:3]
+    return _AREA_ACTIONS.get(area, {}).get(level, [])[:3]
+
+
+# Things to avoid per area in weaker periods
+_AREA_AVOID_ITEMS = {
+    "love": [
+        "Arguments and confrontations",
+        "Making hasty relationship decisions",
+        "Neglecting partner's feelings",
+        "Being overly critical or demanding"
+    ],
+    "career": [
+        "Conflicts with superiors",
+        "Taking unnecessary risks",
+        "Changing jobs impulsively",
+        "Overcommitting to projects"
+    ],
+    "wealth": [
+        "Speculative investments",
+        "Lending money to others",
+        "Unnecessary luxury spending",
+        "Starting new financial ventures"
+    ],
+    "health": [
+        "Ignoring health symptoms",
+        "Excessive stress or overwork",
+        "Unhealthy food and habits",
+        "Skipping medications or checkups"
+    ]
+}
 
 
 def _get_avoid_items(area: str, rating: int) -> List[str]:
@@ -765,64 +927,34 @@ def _get_avoid_items(area: str, rating: int) -> List[str]:
     if rating >= 7:
         return ["Overconfidence", "Complacency"]
     
-    avoid = {
-        "love": [
-            "Arguments and confrontations",
-            "Making hasty relationship decisions",
-            "Neglecting partner's feelings",
-            "Being overly critical or demanding"
-        ],
-        "career": [
-            "Conflicts with superiors",
-            "Taking unnecessary risks",
-            "Changing jobs impulsively",
-            "Overcommitting to projects"
-        ],
-        "wealth": [
-            "Speculative investments",
-            "Lending money to others",
-            "Unnecessary luxury spending",
-            "Starting new financial ventures"
-        ],
-        "health": [
-            "Ignoring health symptoms",
-            "Excessive stress or overwork",
-            "Unhealthy food and habits",
-            "Skipping medications or checkups"
-        ]
-    }
-    
-    return avoid.get(area, [])[:3]
+    return _AREA_AVOID_ITEMS.get(area, [])[:3]
 
 
 def _create_area_overview(predictions: List[Dict], area: str) -> Dict:
-    """Create overview of area predictions"""
+    """Create overview from per-month {"month", "rating", "dates"} rows"""
     
     if not predictions:
         return {}
     
     # Find best and worst months
-    sorted_preds = sorted(predictions, key=lambda x: x["rating"], reverse=True)
-    best_months = sorted_preds[:3]
-    worst_months = sorted_preds[-3:]
-    
-    # Calculate average rating
-    avg_rating = sum(p["rating"] for p in predictions) / len(predictions)
-    
-    # Determine trend
-    first_half = predictions[:len(predictions)//2]
-    second_half = predictions[len(predictions)//2:]
+    by_rating = itemgetter("rating")
+    best_months = heapq.nlargest(3, predictions, key=by_rating)
+    worst_months = heapq.nsmallest(3, reversed(predictions), key=by_rating)[::-1]
+    
+    # Overall and half-period sums in a single pass
+    half = len(predictions) // 2
+    first_sum = second_sum = 0
+    for i, p in enumerate(predictions):
+        if i < half:
+            first_sum += p["rating"]
+        else:
+            second_sum += p["rating"]
     
-    # Handle edge cases where halves might be empty
-    if not first_half:
-        first_avg = avg_rating  # Use overall average if no first half
-    else:
-        first_avg = sum(p["rating"] for p in first_half) / len(first_half)
+    avg_rating = (first_sum + second_sum) / len(predictions)
     
-    if not second_half:
-        second_avg = avg_rating  # Use overall average if no second half
-    else:
-        second_avg = sum(p["rating"] for p in second_half) / len(second_half)
+    # Determine trend (the first half is empty for a single month, so fall back to the average)
+    first_avg = first_sum / half if half else avg_rating
+    second_avg = second_sum / (len(predictions) - half)
     
     if second_avg > first_avg + 1:
         trend = "Improving - Things get better as time progresses"
@@ -834,51 +966,35 @@ def _create_area_overview(predictions: List[Dict], area: str) -> Dict:
     return {
         "average_rating": round(avg_rating, 1),
         "trend": trend,
-        "best_months": [
-            {
-                "month": m["month"],
-                "rating": m["rating"],
-                "dates": f"{m['date_range']['start']} to {m['date_range']['end']}"
-            }
-            for m in best_months
-        ],
-        "challenging_months": [
-            {
-                "month": m["month"],
-                "rating": m["rating"],
-                "dates": f"{m['date_range']['start']} to {m['date_range']['end']}"
-            }
-            for m in worst_months
-        ],
+        "best_months": best_months,
+        "challenging_months": worst_months,
         "overall_guidance": _get_overall_guidance(area, avg_rating, trend)
     }
 
 
+# Period quality and (capitalized) action by average rating band
+_GUIDANCE_THRESHOLDS = (5, 7)
+_GUIDANCE_LEVELS = (
+    ("challenging", "Focus on building foundation and exercising patience"),
+    ("good", "Make steady progress with balanced approach"),
+    ("excellent", "Take full advantage of this favorable period")
+)
+
+
 def _get_overall_guidance(area: str, avg_rating: float, trend: str) -> str:
     """Get overall guidance for the period"""
-    
-    if avg_rating >= 7:
-        quality = "excellent"
-        action = "take full advantage of this favorable period"
-    elif avg_rating >= 5:
-        quality = "good"
-        action = "make steady progress with balanced approach"
-    else:
-        quality = "challenging"
-        action = "focus on building foundation and exercising patience"
-    
-    return f"This is a {quality} period for {area}. {action.capitalize()}. {trend}"
+    quality, action = _GUIDANCE_LEVELS[bisect_right(_GUIDANCE_THRESHOLDS, avg_rating)]
+    return f"This is a {quality} period for {area}. {action}. {trend}"
 
 
 def _fix_date_format(date_str: str) -> str:
     """Try to fix common date format issues"""
-    import re
     
     # Handle cases like "2025-11-2025" -> assume it's "2025-11-25" (day repeated)
-    if re.match(r'^\d{4}-\d{2}-\d{4}$', date_str):
-        parts = date_str.split('-')
-        if len(parts) == 3:
-            year1, month, year2 = parts
+    parts = date_str.split('-')
+    if len(date_str) == 12 and len(parts) == 3 and all(part.isdecimal() for part in parts):
+        year1, month, year2 = parts
+        if len(year1) == 4 and len(month) == 2:
             if year1 == year2[:4]:  # Year repeated
                 # Extract the day from the repeated year part
                 if len(year2) > 4:
@@ -894,26 +1010,21 @@ def _fix_date_format(date_str: str) -> str:
     
     # Handle other common formats
     # MM/DD/YYYY -> YYYY-MM-DD
-    match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{4})$', date_str)
-    if match:
-        month, day, year = match.groups()
-        try:
-            return f"{year}-{int(month):02d}-{int(day):02d}"
-        except ValueError:
-            pass
-    
-    # DD/MM/YYYY -> YYYY-MM-DD  
-    match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{4})$', date_str)
-    if match:
-        day, month, year = match.groups()
-        try:
+    parts = date_str.split('/')
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        month, day, year = parts
+        if 1 <= len(month) <= 2 and 1 <= len(day) <= 2 and len(year) == 4:
             return f"{year}-{int(month):02d}-{int(day):02d}"
-        except ValueError:
-            pass
     
     return None
 
 
+# LRU of recent wildcard predictions (refreshing a prediction page repeats the same request)
+WILDCARD_CACHE_SIZE = 2048
+_WILDCARD_CACHE = OrderedDict()
+_WILDCARD_CACHE_LOCK = threading.Lock()
+
+
 def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
                                  query: str, specific_date: str = None) -> Dict[str, Any]:
     """
@@ -930,14 +1041,54 @@ def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
         Detailed prediction with success probability, timing, and advice
     """
     
+    # Results only depend on the chart, location, query and (for the date fallback) today
+    now = datetime.now()
+    cache_key = (_natal_fingerprint(natal_chart), round(lat, 4), round(lon, 4),
+                 query, specific_date, now.date())
+    
+    with _WILDCARD_CACHE_LOCK:
+        cached = _WILDCARD_CACHE.get(cache_key)
+        if cached is not None:
+            _WILDCARD_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    
+    prediction = _build_wildcard_prediction(natal_chart, lat, lon, query, specific_date, now)
+    
+    with _WILDCARD_CACHE_LOCK:
+        _WILDCARD_CACHE[cache_key] = copy.deepcopy(prediction)
+        if len(_WILDCARD_CACHE) > WILDCARD_CACHE_SIZE:
+            _WILDCARD_CACHE.popitem(last=False)
+    
+    return prediction
+
+
+def _natal_fingerprint(natal_chart: Dict) -> Tuple:
+    """Hashable summary of the natal fields a wildcard prediction reads"""
+    return (
+        natal_chart["ascendant"]["sign"],
+        tuple(
+            (planet_name, planet_data.get("sign"), planet_data.get("house"),
+             planet_data.get("dignity"), bool(planet_data.get("is_exalted")))
+            for planet_name, planet_data in natal_chart.get("planets", {}).items()
+        )
+    )
+
+
+def _build_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
+                               query: str, specific_date: str, now: datetime) -> Dict[str, Any]:
+    """Uncached body of generate_wildcard_prediction"""
+    
+    # Fallback date for queries without a usable date
+    fallback_date = now + timedelta(days=15)
+    
     # Extract date from query if not provided or invalid
     if not specific_date:
         specific_date = extract_date_from_query(query)
     
     if not specific_date:
         # If no specific date, analyze near future (next 30 days)
-        target_date = datetime.now() + timedelta(days=15)
-        specific_date = target_date.strftime("%Y-%m-%d")
+        specific_date = fallback_date.strftime("%Y-%m-%d")
         date_extracted = False
     else:
         # Validate and fix the provided specific_date
@@ -959,65 +1110,52 @@ def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
                     date_extracted = True
                 else:
                     # If no valid date found anywhere, use fallback
-                    target_date = datetime.now() + timedelta(days=15)
-                    specific_date = target_date.strftime("%Y-%m-%d")
+                    specific_date = fallback_date.strftime("%Y-%m-%d")
                     date_extracted = False
     
     try:
         event_date = datetime.strptime(specific_date, "%Y-%m-%d")
     except ValueError:
         # Final fallback if all else fails
-        event_date = datetime.now() + timedelta(days=15)
+        event_date = fallback_date
         date_extracted = False
     
+    # Weekday lookups shared by the hour and lucky-factor helpers
+    day_name = _DAY_NAMES[event_date.weekday()]
+    day_index = (event_date.weekday() + 1) % 7  # Sunday-first
+    
     # Analyze query to determine area of concern
     query_lower = query.lower()
     
     area = "general"
     concern_type = "event"
     
-    if any(word in query_lower for word in ["date", "love", "romance", "relationship", "marry", "propose", "lucky"]):
-        area = "love"
-        concern_type = "romance"
-    elif any(word in query_lower for word in ["job", "interview", "promotion", "career", "work", "redundancy", "fired"]):
-        area = "career"
-        concern_type = "professional"
-    elif any(word in query_lower for word in ["money", "investment", "business", "financial", "buy", "purchase", "contract"]):
-        area = "wealth"
-        concern_type = "financial"
-    elif any(word in query_lower for word in ["health", "safe", "safety", "accident", "motorcycle", "surgery", "medical"]):
-        area = "health"
-        concern_type = "safety"
-    
-    # Calculate transit positions for the event date
-    jd = LocalCalculate.get_julian_day(event_date)
-    ayanamsa = LocalCalculate.get_ayanamsa(jd)
-    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
+    for pattern_area, pattern_concern, pattern in _AREA_PATTERNS:
+        if pattern.search(query_lower):
+            area = pattern_area
+            concern_type = pattern_concern
+            break
     
     # Get all planetary positions on event date
-    event_planets = {}
-    for planet_name in [PlanetName.SUN, PlanetName.MOON, PlanetName.MARS, 
-                       PlanetName.MERCURY, PlanetName.JUPITER, PlanetName.VENUS,
-                       PlanetName.SATURN, PlanetName.RAHU, PlanetName.KETU]:
-        planet_long = LocalCalculate.get_planet_longitude(planet_name, jd, ayanamsa)
-        planet_house = LocalCalculate.get_planet_house(planet_long, house_cusps)
-        planet_sign, _ = LocalCalculate.longitude_to_sign(planet_long)
-        planet_nakshatra, _ = LocalCalculate.get_nakshatra(planet_long)
-        
-        event_planets[planet_name] = {
-            "longitude": round(planet_long, 2),
+    jd = LocalCalculate.get_julian_day(event_date)
+    event_planets = {
+        planet_name: {
+            "longitude": planet_long,
             "sign": planet_sign,
             "house": planet_house,
             "nakshatra": planet_nakshatra
         }
+        for planet_name, planet_long, planet_sign, planet_house, planet_nakshatra
+        in _event_positions(round(jd, 6), round(lat, 4), round(lon, 4))
+    }
     
     # Calculate success probability
     success_probability = _calculate_success_probability(
         natal_chart, event_planets, area, concern_type, query_lower
     )
     
-    # Get best time of day
-    best_hours = _calculate_best_hours(event_date, natal_chart, area)
+    # Best time of day and lucky factors from one pass over the day
+    best_hours, lucky_factors = _analyze_day(day_index, day_name, event_planets, natal_chart, area)
     
     # Get specific advice
     specific_advice = _generate_specific_advice(
@@ -1027,17 +1165,15 @@ def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
     # Get remedies
     remedies = _get_event_specific_remedies(success_probability, area, event_planets)
     
-    # Get lucky factors
-    lucky_factors = _get_lucky_factors(event_date, event_planets, natal_chart)
-    
     # Risk assessment
-    risks = _assess_risks(success_probability, area, concern_type, event_planets, query_lower)
+    risk_codes = _assess_risk_codes(event_planets, query_lower)
+    risks = _assess_risks(success_probability, risk_codes)
     
     return {
         "query": query,
         "event_date": {
             "date": event_date.strftime("%Y-%m-%d"),
-            "day": event_date.strftime("%A"),
+            "day": day_name,
             "full_date": event_date.strftime("%A, %B %d, %Y"),
             "extracted_from_query": date_extracted
         },
@@ -1045,17 +1181,14 @@ def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
         "concern_type": concern_type,
         "success_probability": {
             "percentage": success_probability,
-            "rating": "Very High" if success_probability >= 80 else
-                     "High" if success_probability >= 65 else
-                     "Moderate" if success_probability >= 50 else
-                     "Low" if success_probability >= 35 else "Very Low",
+            "rating": _PROBABILITY_RATINGS[bisect_right(_PROBABILITY_THRESHOLDS, success_probability)],
             "interpretation": _interpret_probability(success_probability, concern_type)
         },
         "planetary_positions_on_date": event_planets,
         "best_time_of_day": best_hours,
         "specific_advice": specific_advice,
         "risks_and_challenges": risks,
-        "mitigation_strategies": _get_mitigation_strategies(risks, area),
+        "mitigation_strategies": _get_mitigation_strategies(risk_codes, area),
         "remedies": remedies,
         "lucky_factors": lucky_factors,
         "overall_recommendation": _get_overall_recommendation(success_probability, area, concern_type),
@@ -1067,6 +1200,44 @@ def generate_wildcard_prediction(natal_chart: Dict, lat: float, lon: float,
     }
 
 
+# Key planets (with weights) behind each area's success probability
+_AREA_KEY_PLANETS = {
+    "love": [(PlanetName.VENUS, 20), (PlanetName.MOON, 15), (PlanetName.JUPITER, 10)],
+    "career": [(PlanetName.SUN, 20), (PlanetName.SATURN, 15), (PlanetName.MERCURY, 10)],
+    "wealth": [(PlanetName.JUPITER, 20), (PlanetName.MERCURY, 15), (PlanetName.VENUS, 10)],
+    "health": [(PlanetName.SUN, 20), (PlanetName.MOON, 15), (PlanetName.MARS, 10)],
+    "general": [(PlanetName.JUPITER, 15), (PlanetName.VENUS, 10), (PlanetName.SUN, 10)]
+}
+
+# Moon nakshatras that raise / lower success probability
+_FAVORABLE_NAKSHATRAS = frozenset({"Rohini", "Pushya", "Hasta", "Shravana", "Revati"})
+_CHALLENGING_NAKSHATRAS = frozenset({"Ashlesha", "Jyeshtha", "Moola", "Ardra"})
+
+# Query words that mark a risk-averse question
+_NEGATIVE_KEYWORDS = frozenset({"redundancy", "fired", "accident", "problem", "fail"})
+
+
+@lru_cache(maxsize=4096)
+def _event_positions(jd: float, lat: float, lon: float) -> Tuple[Tuple, ...]:
+    """(planet, rounded longitude, sign, house, nakshatra) for every planet at an instant"""
+    ayanamsa = LocalCalculate.get_ayanamsa(jd)
+    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
+    
+    # One batch of longitudes, then signs, nakshatras and houses as array ops
+    longitudes = LocalCalculate.get_all_planet_longitudes(jd, ayanamsa)
+    signs = _ZODIAC_SIGN_NAMES[(longitudes // 30).astype(int)]
+    nakshatras = _NAKSHATRA_NAMES[(longitudes / 13.333333).astype(int)]
+    houses = LocalCalculate.get_planet_houses_batch(longitudes[None, :], np.array([house_cusps]))[0]
+    
+    return tuple(zip(
+        EVENT_PLANETS,
+        [round(planet_long, 2) for planet_long in longitudes.tolist()],
+        signs.tolist(),
+        houses.tolist(),
+        nakshatras.tolist()
+    ))
+
+
 def _calculate_success_probability(natal_chart: Dict, event_planets: Dict,
                                    area: str, concern_type: str, query: str) -> int:
     """Calculate success probability percentage (0-100)"""
@@ -1074,131 +1245,56 @@ def _calculate_success_probability(natal_chart: Dict, event_planets: Dict,
     base_score = 50  # Start at 50%
     
     # Check key planets for the area
-    area_key_planets = {
-        "love": [("Venus", 20), ("Moon", 15), ("Jupiter", 10)],
-        "career": [("Sun", 20), ("Saturn", 15), ("Mercury", 10)],
-        "wealth": [("Jupiter", 20), ("Mercury", 15), ("Venus", 10)],
-        "health": [("Sun", 20), ("Moon", 15), ("Mars", 10)],
-        "general": [("Jupiter", 15), ("Venus", 10), ("Sun", 10)]
-    }
-    
-    key_planets = area_key_planets.get(area, area_key_planets["general"])
-    
-    for planet, weight in key_planets:
-        planet_data = event_planets.get(planet, {})
-        house = planet_data.get("house", 6)
+    for planet, weight in _AREA_KEY_PLANETS.get(area, _AREA_KEY_PLANETS["general"]):
+        house = event_planets.get(planet, {}).get("house", 6)
         
-        # Benefic houses increase probability
-        if house in [1, 2, 4, 5, 7, 9, 10, 11]:
+        # Benefic houses increase probability, the neutral 3rd adds a little,
+        # everything else decreases it
+        if (_BENEFIC_MASK >> house) & 1:
             base_score += weight * 0.3
-        # Neutral houses
-        elif house in [3]:
+        elif (_NEUTRAL_MASK >> house) & 1:
             base_score += weight * 0.1
-        # Malefic houses decrease probability
         else:
             base_score -= weight * 0.3
     
     # Moon's influence (emotional/mental state)
-    moon_data = event_planets.get("Moon", {})
-    moon_nakshatra = moon_data.get("nakshatra", "")
-    
-    # Favorable nakshatras
-    if moon_nakshatra in ["Rohini", "Pushya", "Hasta", "Shravana", "Revati"]:
+    moon_nakshatra = event_planets.get(PlanetName.MOON, {}).get("nakshatra", "")
+    if moon_nakshatra in _FAVORABLE_NAKSHATRAS:
         base_score += 10
-    # Challenging nakshatras
-    elif moon_nakshatra in ["Ashlesha", "Jyeshtha", "Moola", "Ardra"]:
+    elif moon_nakshatra in _CHALLENGING_NAKSHATRAS:
         base_score -= 10
     
-    # Check for negative keywords in query
-    if any(word in query for word in ["redundancy", "fired", "accident", "problem", "fail"]):
-        # These are risk-averse queries, adjust score accordingly
-        if "safe" in query or "avoid" in query:
-            pass  # User asking about safety, don't penalize
-        else:
-            base_score -= 5
+    # Risk-averse queries are penalized unless the user is asking about safety
+    if any(word in query for word in _NEGATIVE_KEYWORDS) and not ("safe" in query or "avoid" in query):
+        base_score -= 5
     
     # Normalize to 0-100
     return max(0, min(100, int(base_score)))
 
 
-def _calculate_best_hours(event_date: datetime, natal_chart: Dict, area: str) -> List[Dict]:
-    """Calculate best hours of the day for the event"""
-    
-    # Planetary hours (simplified)
-    planet_order = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
-    day_order = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    
-    day_name = event_date.strftime("%A")
-    day_index = day_order.index(day_name) if day_name in day_order else 0
-    
-    # Get ruling planets for the area
-    area_planets = {
-        "love": ["Venus", "Moon"],
-        "career": ["Sun", "Jupiter"],
-        "wealth": ["Jupiter", "Mercury"],
-        "health": ["Sun", "Moon"],
-        "general": ["Jupiter", "Venus"]
-    }
-    
-    favorable_planets = area_planets.get(area, area_planets["general"])
-    
-    best_hours = []
-    
-    # Calculate planetary hours (simplified version)
-    hour_blocks = [
-        {"start": "06:00", "end": "09:00", "period": "Early Morning"},
-        {"start": "09:00", "end": "12:00", "period": "Late Morning"},
-        {"start": "12:00", "end": "15:00", "period": "Afternoon"},
-        {"start": "15:00", "end": "18:00", "period": "Evening"},
-        {"start": "18:00", "end": "21:00", "period": "Night"}
-    ]
-    
-    for i, block in enumerate(hour_blocks):
-        # Simple planetary hour calculation
-        planet_index = (day_index + i) % 7
-        ruling_planet = planet_order[planet_index]
-        
-        if ruling_planet in favorable_planets:
-            best_hours.append({
-                "time_range": f"{block['start']} - {block['end']}",
-                "period": block['period'],
-                "ruling_planet": ruling_planet,
-                "quality": "Highly Favorable",
-                "recommendation": f"Best time for {area}-related activities"
-            })
-    
-    if not best_hours:
-        # If no specific favorable hours, suggest general good times
-        best_hours = [
-            {
-                "time_range": "09:00 - 12:00",
-                "period": "Late Morning",
-                "quality": "Favorable",
-                "recommendation": "Generally auspicious time for most activities"
-            }
-        ]
-    
-    return best_hours[:3]
+# General advice bands (bisect_right index) by success probability
+_ADVICE_THRESHOLDS = (50, 70)
+_PROBABILITY_ADVICE = (
+    ("Lower probability - consider postponing if possible",
+     "If must proceed, take extra precautions",
+     "Focus on damage control and risk mitigation"),
+    ("Moderate probability - prepare thoroughly before proceeding",
+     "Success possible with proper planning and effort",
+     "Stay positive but remain realistic about expectations"),
+    ("High probability of success - proceed with confidence",
+     "This is a favorable time for {concern_type} matters",
+     "Trust your instincts and take decisive action"),
+)
 
 
 def _generate_specific_advice(probability: int, area: str, concern_type: str,
                               query: str, event_planets: Dict) -> List[str]:
     """Generate specific advice based on the situation"""
     
-    advice = []
-    
-    if probability >= 70:
-        advice.append(f"High probability of success - proceed with confidence")
-        advice.append(f"This is a favorable time for {concern_type} matters")
-        advice.append("Trust your instincts and take decisive action")
-    elif probability >= 50:
-        advice.append(f"Moderate probability - prepare thoroughly before proceeding")
-        advice.append(f"Success possible with proper planning and effort")
-        advice.append("Stay positive but remain realistic about expectations")
-    else:
-        advice.append(f"Lower probability - consider postponing if possible")
-        advice.append(f"If must proceed, take extra precautions")
-        advice.append("Focus on damage control and risk mitigation")
+    advice = [
+        line.format(concern_type=concern_type)
+        for line in _PROBABILITY_ADVICE[bisect_right(_ADVICE_THRESHOLDS, probability)]
+    ]
     
     # Area-specific advice
     if area == "love":
@@ -1241,101 +1337,106 @@ def _generate_specific_advice(probability: int, area: str, concern_type: str,
     return advice
 
 
-def _assess_risks(probability: int, area: str, concern_type: str,
-                 event_planets: Dict, query: str) -> List[Dict]:
-    """Assess risks and challenges"""
-    
-    risks = []
+# Risk codes raised for a wildcard event
+(RISK_MARS_DUSTHANA, RISK_SATURN_DUSTHANA, RISK_RAHU_DUSTHANA,
+ RISK_VEHICLE, RISK_JOB_SECURITY, RISK_GENERAL) = range(6)
+
+# Per risk code: factor, (risk level below / at-or-above 50% probability), description, impact areas
+_RISK_DETAILS = (
+    ("Mars in challenging position", ("Moderate", "Moderate"),
+     "Potential for conflicts, accidents, or aggressive situations",
+     ("conflicts", "accidents", "impulsiveness")),
+    ("Saturn creating obstacles", ("Moderate", "Moderate"),
+     "Possible delays, restrictions, or additional responsibilities",
+     ("delays", "obstacles", "pessimism")),
+    ("Rahu causing confusion", ("Low to Moderate", "Low to Moderate"),
+     "Potential for unexpected situations or deception",
+     ("confusion", "deception", "unexpected events")),
+    ("Vehicle safety concern", ("High", "Moderate"),
+     "Need for extra caution while riding",
+     ("accidents", "health", "safety")),
+    ("Job security concern", ("High", "Low"),
+     "Organizational changes affecting employment",
+     ("career", "income", "stress")),
+    ("General life challenges", ("Low", "Low"),
+     "Normal life uncertainties apply",
+     ("general",))
+)
+
+# Mitigation strategies per risk code
+_MITIGATIONS_BY_CODE = (
+    ("Practice patience and avoid conflicts",
+     "Channel energy into productive activities"),
+    ("Be prepared for delays and have backup plans",
+     "Focus on long-term thinking and discipline"),
+    ("Verify information carefully before acting",
+     "Avoid get-rich-quick schemes or shortcuts"),
+    ("Wear proper safety gear at all times",
+     "Avoid riding in bad weather or at night",
+     "Take a defensive driving course",
+     "Regular vehicle maintenance is crucial"),
+    ("Document your achievements and contributions",
+     "Build relationships across the organization",
+     "Develop new skills to increase value",
+     "Maintain a financial safety net"),
+    ()
+)
+
+
+def _assess_risk_codes(event_planets: Dict, query: str) -> List[int]:
+    """Risk codes for malefics in dusthanas and risky query topics"""
+    
+    codes = []
     
     # Check malefic planets in challenging houses
-    mars_house = event_planets.get("Mars", {}).get("house", 0)
-    saturn_house = event_planets.get("Saturn", {}).get("house", 0)
-    rahu_house = event_planets.get("Rahu", {}).get("house", 0)
-    
-    if mars_house in [6, 8, 12]:
-        risks.append({
-            "factor": "Mars in challenging position",
-            "risk_level": "Moderate",
-            "description": "Potential for conflicts, accidents, or aggressive situations",
-            "impact_areas": ["conflicts", "accidents", "impulsiveness"]
-        })
-    
-    if saturn_house in [6, 8, 12]:
-        risks.append({
-            "factor": "Saturn creating obstacles",
-            "risk_level": "Moderate",
-            "description": "Possible delays, restrictions, or additional responsibilities",
-            "impact_areas": ["delays", "obstacles", "pessimism"]
-        })
-    
-    if rahu_house in [6, 8, 12]:
-        risks.append({
-            "factor": "Rahu causing confusion",
-            "risk_level": "Low to Moderate",
-            "description": "Potential for unexpected situations or deception",
-            "impact_areas": ["confusion", "deception", "unexpected events"]
-        })
+    for planet, code in ((PlanetName.MARS, RISK_MARS_DUSTHANA),
+                         (PlanetName.SATURN, RISK_SATURN_DUSTHANA),
+                         (PlanetName.RAHU, RISK_RAHU_DUSTHANA)):
+        if (_MALEFIC_MASK >> event_planets.get(planet, {}).get("house", 0)) & 1:
+            codes.append(code)
     
     # Query-specific risks
     if "motorcycle" in query or "bike" in query:
-        risks.append({
-            "factor": "Vehicle safety concern",
-            "risk_level": "High" if probability < 50 else "Moderate",
-            "description": "Need for extra caution while riding",
-            "impact_areas": ["accidents", "health", "safety"]
-        })
+        codes.append(RISK_VEHICLE)
     
     if "redundancy" in query or "layoff" in query:
-        risks.append({
-            "factor": "Job security concern",
-            "risk_level": "High" if probability < 50 else "Low",
-            "description": "Organizational changes affecting employment",
-            "impact_areas": ["career", "income", "stress"]
-        })
+        codes.append(RISK_JOB_SECURITY)
     
-    if not risks:
-        risks.append({
-            "factor": "General life challenges",
-            "risk_level": "Low",
-            "description": "Normal life uncertainties apply",
-            "impact_areas": ["general"]
-        })
+    if not codes:
+        codes.append(RISK_GENERAL)
     
-    return risks
+    return codes
 
 
-def _get_mitigation_strategies(risks: List[Dict], area: str) -> List[str]:
+# Prebuilt (factor, risk level, description, impact areas) entries per code,
+# as (below 50% probability, at or above 50%)
+_RISK_ENTRIES = tuple(
+    tuple((factor, level, description, impact_areas) for level in levels)
+    for factor, levels, description, impact_areas in _RISK_DETAILS
+)
+
+
+def _assess_risks(probability: int, risk_codes: List[int]) -> List[Dict]:
+    """Assess risks and challenges"""
+    band = 0 if probability < 50 else 1
+    return [
+        {
+            "factor": factor,
+            "risk_level": level,
+            "description": description,
+            "impact_areas": list(impact_areas)
+        }
+        for factor, level, description, impact_areas in (_RISK_ENTRIES[code][band] for code in risk_codes)
+    ]
+
+
+def _get_mitigation_strategies(risk_codes: List[int], area: str) -> List[str]:
     """Get strategies to mitigate identified risks"""
     
     strategies = []
     
-    for risk in risks:
-        risk_level = risk["risk_level"]
-        factor = risk["factor"]
-        
-        if "Mars" in factor:
-            strategies.append("Practice patience and avoid conflicts")
-            strategies.append("Channel energy into productive activities")
-        
-        if "Saturn" in factor:
-            strategies.append("Be prepared for delays and have backup plans")
-            strategies.append("Focus on long-term thinking and discipline")
-        
-        if "Rahu" in factor:
-            strategies.append("Verify information carefully before acting")
-            strategies.append("Avoid get-rich-quick schemes or shortcuts")
-        
-        if "vehicle" in factor.lower() or "motorcycle" in factor.lower():
-            strategies.append("Wear proper safety gear at all times")
-            strategies.append("Avoid riding in bad weather or at night")
-            strategies.append("Take a defensive driving course")
-            strategies.append("Regular vehicle maintenance is crucial")
-        
-        if "job security" in factor.lower() or "redundancy" in factor.lower():
-            strategies.append("Document your achievements and contributions")
-            strategies.append("Build relationships across the organization")
-            strategies.append("Develop new skills to increase value")
-            strategies.append("Maintain a financial safety net")
+    for code in risk_codes:
+        strategies.extend(_MITIGATIONS_BY_CODE[code])
     
     if not strategies:
         strategies = [
@@ -1347,6 +1448,15 @@ def _get_mitigation_strategies(risks: List[Dict], area: str) -> List[str]:
     return strategies[:6]
 
 
+# Remedy for a key planet weakened in a dusthana (6/8/12) on the event date
+_PLANET_DUSTHANA_REMEDIES = {
+    PlanetName.SUN: "Offer water to Sun at sunrise on event day",
+    PlanetName.MOON: "Drink water from silver vessel",
+    PlanetName.MARS: "Donate red items on Tuesday before event",
+    PlanetName.JUPITER: "Wear yellow on the day"
+}
+
+
 def _get_event_specific_remedies(probability: int, area: str, event_planets: Dict) -> List[str]:
     """Get remedies specific to the event"""
     
@@ -1379,252 +1489,487 @@ def _get_event_specific_remedies(probability: int, area: str, event_planets: Dic
         remedies.append("Wear an energized rudraksha")
         remedies.append("Avoid negative thoughts and people")
     
-    # Check for weak planets
+    # Check for weak planets (only the first six remedies are returned)
     for planet, data in event_planets.items():
-        if data.get("house") in [6, 8, 12]:
-            if planet == "Sun":
-                remedies.append("Offer water to Sun at sunrise on event day")
-            elif planet == "Moon":
-                remedies.append("Drink water from silver vessel")
-            elif planet == "Mars":
-                remedies.append("Donate red items on Tuesday before event")
-            elif planet == "Jupiter":
-                remedies.append("Wear yellow on the day")
+        if len(remedies) >= 6:
+            break
+        if (_MALEFIC_MASK >> data.get("house", 0)) & 1:
+            remedy = _PLANET_DUSTHANA_REMEDIES.get(planet)
+            if remedy:
+                remedies.append(remedy)
     
     return remedies[:6]
 
 
-def _get_lucky_factors(event_date: datetime, event_planets: Dict, natal_chart: Dict) -> Dict:
-    """Get lucky factors for the day"""
+# Ruling planets whose hours favor each area
+_BEST_HOUR_PLANETS = {
+    "love": frozenset({"Venus", "Moon"}),
+    "career": frozenset({"Sun", "Jupiter"}),
+    "wealth": frozenset({"Jupiter", "Mercury"}),
+    "health": frozenset({"Sun", "Moon"}),
+    "general": frozenset({"Jupiter", "Venus"})
+}
+
+# Planetary hours (simplified), starting from Sunday's ruler
+_HOUR_PLANET_ORDER = ("Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars")
+
+# Daytime blocks (time range, period) used for the simplified planetary hours
+_HOUR_BLOCKS = (
+    ("06:00 - 09:00", "Early Morning"),
+    ("09:00 - 12:00", "Late Morning"),
+    ("12:00 - 15:00", "Afternoon"),
+    ("15:00 - 18:00", "Evening"),
+    ("18:00 - 21:00", "Night")
+)
+
+# Ruling planet of each block, per weekday (Sunday=0..Saturday=6)
+_HOUR_RULERS = tuple(
+    tuple(_HOUR_PLANET_ORDER[(day_index + i) % 7] for i in range(len(_HOUR_BLOCKS)))
+    for day_index in range(7)
+)
+
+# Lucky colors based on day of week
+_DAY_COLORS = {
+    "Sunday": ("Red", "Orange", "Gold"),
+    "Monday": ("White", "Silver", "Light Blue"),
+    "Tuesday": ("Red", "Maroon", "Scarlet"),
+    "Wednesday": ("Green", "Light Green", "Emerald"),
+    "Thursday": ("Yellow", "Gold", "Cream"),
+    "Friday": ("White", "Pink", "Light Blue"),
+    "Saturday": ("Black", "Dark Blue", "Navy")
+}
+
+# Lucky (direction, gemstone) by ascendant
+_ASCENDANT_LUCK = {
+    "Aries": ("East", "Red Coral"),
+    "Taurus": ("South-East", "Diamond"),
+    "Gemini": ("North", "Emerald"),
+    "Cancer": ("North-West", "Pearl"),
+    "Leo": ("East", "Ruby"),
+    "Virgo": ("South", "Emerald"),
+    "Libra": ("West", "Diamond"),
+    "Scorpio": ("South", "Red Coral"),
+    "Sagittarius": ("North-East", "Yellow Sapphire"),
+    "Capricorn": ("South", "Blue Sapphire"),
+    "Aquarius": ("West", "Blue Sapphire"),
+    "Pisces": ("North", "Yellow Sapphire")
+}
+_DEFAULT_ASCENDANT_LUCK = ("East", "Clear Quartz")
+
+
+def _analyze_day(day_index: int, day_name: str, event_planets: Dict,
+                 natal_chart: Dict, area: str) -> Tuple[List[Dict], Dict]:
+    """Best hours and lucky factors for the event day (day_index: Sunday=0..Saturday=6)"""
     
-    # Lucky colors based on day of week
-    day_colors = {
-        "Sunday": ["Red", "Orange", "Gold"],
-        "Monday": ["White", "Silver", "Light Blue"],
-        "Tuesday": ["Red", "Maroon", "Scarlet"],
-        "Wednesday": ["Green", "Light Green", "Emerald"],
-        "Thursday": ["Yellow", "Gold", "Cream"],
-        "Friday": ["White", "Pink", "Light Blue"],
-        "Saturday": ["Black", "Dark Blue", "Navy"]
-    }
+    # Get ruling planets for the area
+    favorable_planets = _BEST_HOUR_PLANETS.get(area, _BEST_HOUR_PLANETS["general"])
+    
+    best_hours = []
+    
+    # Planetary hours (simplified version) from the precomputed weekday rulers
+    for (time_range, period), ruling_planet in zip(_HOUR_BLOCKS, _HOUR_RULERS[day_index]):
+        if ruling_planet in favorable_planets:
+            best_hours.append({
+                "time_range": time_range,
+                "period": period,
+                "ruling_planet": ruling_planet,
+                "quality": "Highly Favorable",
+                "recommendation": f"Best time for {area}-related activities"
+            })
     
-    day_name = event_date.strftime("%A")
+    if not best_hours:
+        # If no specific favorable hours, suggest general good times
+        best_hours = [
+            {
+                "time_range": "09:00 - 12:00",
+                "period": "Late Morning",
+                "quality": "Favorable",
+                "recommendation": "Generally auspicious time for most activities"
+            }
+        ]
     
-    # Lucky numbers based on planets
-    moon_nak = event_planets.get("Moon", {}).get("nakshatra", "")
-    lucky_numbers = [1, 3, 5, 7, 9]  # Default
+    # Deity for the planet that needs strengthening
+    jupiter_house = event_planets.get(PlanetName.JUPITER, {}).get("house", 1)
+    venus_house = event_planets.get(PlanetName.VENUS, {}).get("house", 1)
     
-    # Lucky directions
-    ascendant = natal_chart["ascendant"]["sign"]
-    directions = {
-        "Aries": "East", "Taurus": "South-East", "Gemini": "North",
-        "Cancer": "North-West", "Leo": "East", "Virgo": "South",
-        "Libra": "West", "Scorpio": "South", "Sagittarius": "North-East",
-        "Capricorn": "South", "Aquarius": "West", "Pisces": "North"
-    }
+    if (_MALEFIC_MASK >> jupiter_house) & 1:
+        deity = "Lord Vishnu or Guru (Jupiter deity)"
+    elif (_MALEFIC_MASK >> venus_house) & 1:
+        deity = "Goddess Lakshmi (Venus deity)"
+    else:
+        deity = "Lord Ganesha (remover of obstacles)"
     
-    return {
-        "colors": day_colors.get(day_name, ["White", "Gold"]),
-        "numbers": lucky_numbers[:5],
-        "direction": directions.get(ascendant, "East"),
-        "gemstone": _get_lucky_gemstone(event_planets, natal_chart),
-        "deity_to_worship": _get_deity_for_area(event_planets)
-    }
-
-
-def _get_lucky_gemstone(event_planets: Dict, natal_chart: Dict) -> str:
-    """Get lucky gemstone for the event"""
-    
-    # Based on ascendant
-    ascendant = natal_chart["ascendant"]["sign"]
-    
-    gemstones = {
-        "Aries": "Red Coral",
-        "Taurus": "Diamond",
-        "Gemini": "Emerald",
-        "Cancer": "Pearl",
-        "Leo": "Ruby",
-        "Virgo": "Emerald",
-        "Libra": "Diamond",
-        "Scorpio": "Red Coral",
-        "Sagittarius": "Yellow Sapphire",
-        "Capricorn": "Blue Sapphire",
-        "Aquarius": "Blue Sapphire",
-        "Pisces": "Yellow Sapphire"
+    # Lucky direction and gemstone from the ascendant
+    direction, gemstone = _ASCENDANT_LUCK.get(natal_chart["ascendant"]["sign"], _DEFAULT_ASCENDANT_LUCK)
+    
+    lucky_factors = {
+        "colors": list(_DAY_COLORS.get(day_name, ("White", "Gold"))),
+        "numbers": [1, 3, 5, 7, 9],  # Default lucky numbers
+        "direction": direction,
+        "gemstone": gemstone,
+        "deity_to_worship": deity
     }
     
-    return gemstones.get(ascendant, "Clear Quartz")
+    return best_hours[:3], lucky_factors
 
 
-def _get_deity_for_area(event_planets: Dict) -> str:
-    """Get deity to worship based on planetary positions"""
-    
-    # Check which planet needs strengthening
-    jupiter_house = event_planets.get("Jupiter", {}).get("house", 1)
-    venus_house = event_planets.get("Venus", {}).get("house", 1)
-    
-    if jupiter_house in [6, 8, 12]:
-        return "Lord Vishnu or Guru (Jupiter deity)"
-    elif venus_house in [6, 8, 12]:
-        return "Goddess Lakshmi (Venus deity)"
-    else:
-        return "Lord Ganesha (remover of obstacles)"
+# Success-probability bands (bisect_right index) and their wording
+_PROBABILITY_THRESHOLDS = (35, 50, 65, 80)
+_PROBABILITY_RATINGS = ("Very Low", "Low", "Moderate", "High", "Very High")
+_PROBABILITY_INTERPRETATIONS = (
+    "Difficult planetary configuration. Consider postponing or taking extensive precautions.",
+    "Lower probability but not impossible. Challenging planetary positions requiring extra caution.",
+    "Moderate probability of success. Mixed planetary influences requiring effort and preparation.",
+    "Good chances for positive outcome in {concern_type} matters. Supportive planetary influences.",
+    "Excellent prospects for {concern_type} success. Highly favorable planetary alignment."
+)
 
 
 def _interpret_probability(probability: int, concern_type: str) -> str:
     """Interpret probability percentage"""
-    
-    if probability >= 80:
-        return f"Excellent prospects for {concern_type} success. Highly favorable planetary alignment."
-    elif probability >= 65:
-        return f"Good chances for positive outcome in {concern_type} matters. Supportive planetary influences."
-    elif probability >= 50:
-        return f"Moderate probability of success. Mixed planetary influences requiring effort and preparation."
-    elif probability >= 35:
-        return f"Lower probability but not impossible. Challenging planetary positions requiring extra caution."
-    else:
-        return f"Difficult planetary configuration. Consider postponing or taking extensive precautions."
+    template = _PROBABILITY_INTERPRETATIONS[bisect_right(_PROBABILITY_THRESHOLDS, probability)]
+    return template.format(concern_type=concern_type)
+
+
+# Recommendation bands (bisect_right index) by success probability
+_RECOMMENDATION_THRESHOLDS = (30, 45, 60, 75)
+_RECOMMENDATIONS = (
+    "Not favorable time for {concern_type} matters. Strong recommendation to postpone. If unavoidable, extreme caution required.",
+    "Consider postponing {concern_type} activities if possible. If you must proceed, take all precautions and lower expectations.",
+    "Proceed with caution in {concern_type} matters. Thorough preparation and backup plans recommended.",
+    "Good time to proceed with {concern_type} plans. Prepare well and maintain realistic expectations.",
+    "Proceed with confidence. This is a favorable time for {concern_type} activities. Trust your preparation and stay positive."
+)
 
 
 def _get_overall_recommendation(probability: int, area: str, concern_type: str) -> str:
     """Get overall recommendation"""
-    
-    if probability >= 75:
-        return f"Proceed with confidence. This is a favorable time for {concern_type} activities. Trust your preparation and stay positive."
-    elif probability >= 60:
-        return f"Good time to proceed with {concern_type} plans. Prepare well and maintain realistic expectations."
-    elif probability >= 45:
-        return f"Proceed with caution in {concern_type} matters. Thorough preparation and backup plans recommended."
-    elif probability >= 30:
-        return f"Consider postponing {concern_type} activities if possible. If you must proceed, take all precautions and lower expectations."
-    else:
-        return f"Not favorable time for {concern_type} matters. Strong recommendation to postpone. If unavoidable, extreme caution required."
+    template = _RECOMMENDATIONS[bisect_right(_RECOMMENDATION_THRESHOLDS, probability)]
+    return template.format(concern_type=concern_type)
+
+
+# Transiting planets read by the horoscopes, and their index in the transit tables
+HOROSCOPE_PLANETS = (PlanetName.SUN, PlanetName.MOON, PlanetName.MARS,
+                     PlanetName.MERCURY, PlanetName.JUPITER, PlanetName.VENUS,
+                     PlanetName.SATURN)
+P_SUN, P_MOON, P_MARS, P_MERCURY, P_JUPITER, P_VENUS, P_SATURN = range(len(HOROSCOPE_PLANETS))
+# Transit indices that can turn retrograde (the Sun and Moon never do)
+_RETROGRADE_PLANET_IDS = (P_MARS, P_MERCURY, P_JUPITER, P_VENUS, P_SATURN)
+
+# Daily (mood, energy, advice) by the Moon's transit house from the natal Moon (index house - 1)
+_MOON_TRANSIT_EFFECTS = (
+    ("Confident", 8, "Good day for personal initiatives and self-expression"),
+    ("Stable", 7, "Focus on finances and family matters"),
+    ("Active", 8, "Communication and short travels favored"),
+    ("Comfortable", 6, "Spend time at home, nurture emotional wellbeing"),
+    ("Creative", 9, "Excellent for romance, creativity, and speculation"),
+    ("Challenging", 5, "Be cautious with health and conflicts"),
+    ("Social", 8, "Good for partnerships and collaborations"),
+    ("Introspective", 4, "Avoid major decisions, focus on research and introspection"),
+    ("Optimistic", 9, "Luck and fortune favor you, pursue higher goals"),
+    ("Ambitious", 8, "Career matters highlighted, seek recognition"),
+    ("Rewarding", 9, "Gains and fulfillment of desires indicated"),
+    ("Reflective", 5, "Time for spirituality and letting go, avoid expenses")
+)
+
+# Moon nakshatras that make a day "Good" in the weekly highlights
+_GOOD_DAY_NAKSHATRAS = frozenset({
+    "Rohini", "Pushya", "Hasta", "Shravana", "Revati", "Ashwini", "Uttara Phalguni"
+})
+
+# Lucky color by datetime.weekday() (Monday=0)
+_WEEKDAY_COLORS = (
+    "White",   # Monday - Moon
+    "Red",     # Tuesday - Mars
+    "Green",   # Wednesday - Mercury
+    "Yellow",  # Thursday - Jupiter
+    "White",   # Friday - Venus
+    "Blue",    # Saturday - Saturn
+    "Orange"   # Sunday - Sun
+)
+
+# Favorable focus areas by the Moon's transit house
+_MOON_HOUSE_FOCUS_AREAS = {
+    1: ("Personal growth", "New initiatives"),
+    2: ("Financial planning", "Family time"),
+    3: ("Communication", "Learning"),
+    4: ("Home improvement", "Emotional bonding"),
+    5: ("Creative projects", "Romance"),
+    6: ("Health routines", "Service"),
+    7: ("Partnerships", "Negotiations"),
+    8: ("Research", "Transformation"),
+    9: ("Higher learning", "Travel"),
+    10: ("Career advancement", "Public recognition"),
+    11: ("Networking", "Achieving goals"),
+    12: ("Spirituality", "Letting go")
+}
+
+# Daily favorable areas by (Moon house, Jupiter in a trikona house)
+_FAVORABLE_AREAS = {
+    (house, jupiter_trikona): (areas + ("Learning and wisdom",) * jupiter_trikona)[:3]
+    for house, areas in _MOON_HOUSE_FOCUS_AREAS.items()
+    for jupiter_trikona in (False, True)
+}
+
+# Daily caution notes for the Moon in a dusthana, Saturn in a loss house and Mars in a dusthana
+_CAUTION_NOTES = ("Avoid major commitments", "Financial caution advised", "Manage anger and impulsiveness")
+_CAUTION_AREAS = {
+    flags: tuple(note for flag, note in zip(flags, _CAUTION_NOTES) if flag)[:2] or ("None significant",)
+    for flags in [
+        (moon_flag, saturn_flag, mars_flag)
+        for moon_flag in (False, True) for saturn_flag in (False, True) for mars_flag in (False, True)
+    ]
+}
+
+# Planets rated for each life area in weekly/monthly forecasts
+_PERIOD_AREA_PLANETS = {
+    "career": (P_SUN, P_SATURN, P_JUPITER),
+    "relationships": (P_VENUS, P_JUPITER),
+    "finance": (P_JUPITER, P_VENUS),
+    "health": (P_SUN, P_MARS)
+}
+
+# Period advice per life area and rating level
+_AREA_ADVICE = {
+    "career": {
+        "high": "Excellent time for career advancement. Take initiative on important projects.",
+        "medium": "Steady progress in career. Focus on building skills and relationships.",
+        "low": "Career challenges require patience. Avoid major changes, focus on stability."
+    },
+    "relationships": {
+        "high": "Harmonious period for relationships. Good time for commitments.",
+        "medium": "Relationships stable. Communication is key to growth.",
+        "low": "Relationships need attention. Practice patience and understanding."
+    },
+    "finance": {
+        "high": "Financial gains indicated. Good time for investments.",
+        "medium": "Financial stability maintained. Plan for future growth.",
+        "low": "Financial caution advised. Avoid risks and focus on saving."
+    },
+    "health": {
+        "high": "Good vitality and energy. Maintain healthy routines.",
+        "medium": "Health stable. Regular exercise and diet important.",
+        "low": "Health needs attention. Avoid stress and maintain regular checkups."
+    }
+}
+
+# House groups tested by the natal-strength and horoscope helpers
+_JUPITER_GOOD_HOUSES = frozenset({1, 2, 5, 7, 9, 11})
+_JUPITER_WEALTH_HOUSES = frozenset({1, 2, 5, 9, 11})
+_SATURN_REWARD_HOUSES = frozenset({3, 6, 11})
+_SATURN_HARD_HOUSES = frozenset({1, 4, 7, 8, 10, 12})
+_MARS_DAILY_GOOD_HOUSES = frozenset({1, 3, 6, 10, 11})
+_MARS_GOOD_HOUSES = frozenset({3, 6, 10, 11})
+_LOSS_HOUSES = frozenset({8, 12})
+_DUSTHANA_HOUSES = frozenset({6, 8, 12})
+_VENUS_DAILY_GOOD_HOUSES = frozenset({1, 2, 5, 7, 11})
+_VENUS_WEEKLY_GOOD_HOUSES = frozenset({1, 5, 7})
+_VENUS_GOOD_HOUSES = frozenset({1, 5, 7, 11})
+_SUN_RECOGNITION_HOUSES = frozenset({1, 5, 9, 10})
+_SUN_GAIN_HOUSES = frozenset({2, 11})
+_SUN_CAREER_HOUSES = frozenset({1, 10, 11})
+_MERCURY_WEEKLY_GOOD_HOUSES = frozenset({1, 2, 3, 10})
+_MERCURY_GOOD_HOUSES = frozenset({1, 3, 6, 10})
+_TRIKONA_HOUSES = frozenset({1, 5, 9})
+
+# Houses that raise a life-area rating (the 6/8/12 that lower it are _MALEFIC_MASK)
+_AREA_GOOD_MASK = sum(1 << house for house in (1, 2, 5, 7, 9, 10, 11))
+
+
+# Prebuilt natal strength messages per planet
+_EXALTED_MSG = {planet_name: f"Exalted {planet_name} gives natural advantage" for planet_name in EVENT_PLANETS}
+_OWN_SIGN_MSG = {planet_name: f"{planet_name} in own sign provides stability" for planet_name in EVENT_PLANETS}
 
 
 def _identify_key_strengths(natal_chart: Dict, area: str) -> List[str]:
     """Identify key strengths from natal chart relevant to area"""
     
-    strengths = []
-    
     planets = natal_chart.get("planets", {})
     
-    # Check exalted planets
+    # One pass over the planets; exalted planets still rank ahead of own-sign ones,
+    # and only the first three strengths are kept
+    exalted = []
+    own_sign = []
     for planet_name, planet_data in planets.items():
         if planet_data.get("is_exalted"):
-            strengths.append(f"Exalted {planet_name} gives natural advantage")
+            exalted.append(_EXALTED_MSG[planet_name])
+            if len(exalted) == 3:
+                return exalted
+        if len(own_sign) < 3 and planet_data.get("dignity") == "own_sign":
+            own_sign.append(_OWN_SIGN_MSG[planet_name])
     
-    # Check planets in own sign
-    for planet_name, planet_data in planets.items():
-        if planet_data.get("dignity") == "own_sign":
-            strengths.append(f"{planet_name} in own sign provides stability")
+    strengths = (exalted + own_sign)[:3]
+    if len(strengths) == 3:
+        return strengths
     
     # Area-specific strengths
     if area == "love":
         venus = planets.get("Venus", {})
-        if venus.get("house") in [1, 5, 7, 11]:
+        if venus.get("house") in _VENUS_GOOD_HOUSES:
             strengths.append("Venus well-placed for relationships")
     
     elif area == "career":
         sun = planets.get("Sun", {})
-        if sun.get("house") in [1, 10, 11]:
+        if sun.get("house") in _SUN_CAREER_HOUSES:
             strengths.append("Sun favorable for career growth")
     
     elif area == "wealth":
         jupiter = planets.get("Jupiter", {})
-        if jupiter.get("house") in [1, 2, 5, 9, 11]:
+        if jupiter.get("house") in _JUPITER_WEALTH_HOUSES:
             strengths.append("Jupiter supports financial prosperity")
     
-    if not strengths:
-        strengths = ["Natural resilience and adaptability"]
+    return strengths or ["Natural resilience and adaptability"]
+
+
+@lru_cache(maxsize=1024)
+def _natal_signs(birth_date: str, birth_time: str, lat: float, lon: float) -> Tuple[str, str]:
+    """(Moon sign, ascendant sign) of a birth chart"""
+    natal_chart = calculate_chart(birth_date, birth_time, lat, lon)
+    return natal_chart["planets"]["Moon"]["sign"], natal_chart["ascendant"]["sign"]
+
+
+@lru_cache(maxsize=8192)
+def _ayanamsa_day(jd_int: int) -> float:
+    """Ayanamsa at whole-day resolution (it drifts ~0.00004 deg/day)"""
+    return LocalCalculate.get_ayanamsa(float(jd_int))
+
+
+@lru_cache(maxsize=4096)
+def _compute_transits(jd: float, lat: float, lon: float) -> Tuple[Tuple, Tuple, Tuple, Tuple]:
+    """(longitudes, sign indices, houses, retrograde flags) of HOROSCOPE_PLANETS, indexed by P_*"""
+    ayanamsa = _ayanamsa_day(int(jd))
+    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
+    
+    # One longitude batch, then every house from one searchsorted over the cusps
+    planet_longs = LocalCalculate.get_planet_longitudes_batch(
+        list(HOROSCOPE_PLANETS), np.array([jd]), np.array([ayanamsa])
+    )
+    houses = LocalCalculate.get_planet_houses_batch(planet_longs, np.array([house_cusps]))[0]
+    longitudes = tuple(planet_longs[0].tolist())
+    
+    return (
+        longitudes,
+        tuple(int(planet_long / 30) for planet_long in longitudes),
+        tuple(houses.tolist()),
+        tuple(p in _RETROGRADE_PLANET_IDS and LocalCalculate.is_planet_retrograde(planet_name, jd)
+              for p, planet_name in enumerate(HOROSCOPE_PLANETS))
+    )
+
+
+# Moon's mean sidereal motion (deg/day) and sidereal month (days)
+_MOON_MEAN_MOTION = 13.176
+_SIDEREAL_MONTH = 27.321661
+
+
+def _moon_crossing(start_jd: float, ayanamsa: float, boundary: float, t: float) -> Any:
+    """Days after start_jd when the Moon reaches boundary, refined from guess t (None if unresolved)"""
+    for _ in range(12):
+        moon_long = LocalCalculate.get_planet_longitude(PlanetName.MOON, start_jd + t, ayanamsa)
+        error = (moon_long - boundary + 180) % 360 - 180
+        if abs(error) < 1e-5:
+            return t
+        t -= error / _MOON_MEAN_MOTION
+    return t if abs(error) < 2 else None
+
+
+def _moon_sign_days(start_jd: float, num_days: int, ayanamsa: float, sign_index: int) -> Any:
+    """Day offsets in [0, num_days) whose Moon is in sign_index, from sign crossings (None if unresolved)"""
+    boundary = sign_index * 30
+    
+    def in_sign(day: int) -> bool:
+        return int(LocalCalculate.get_planet_longitude(PlanetName.MOON, start_jd + day, ayanamsa) / 30) == sign_index
+    
+    # Mean-motion guess for the first entry, a month back if the Moon is already in the sign
+    delta = (boundary - LocalCalculate.get_planet_longitude(PlanetName.MOON, start_jd, ayanamsa)) % 360
+    if delta > 330:
+        delta -= 360
+    t_guess = delta / _MOON_MEAN_MOTION
+    
+    days = []
+    while t_guess < num_days:
+        t_enter = _moon_crossing(start_jd, ayanamsa, boundary, t_guess)
+        if t_enter is None:
+            return None
+        if t_enter >= num_days:
+            # The refined entry falls after the month; its exit is not needed
+            break
+        t_exit = _moon_crossing(start_jd, ayanamsa, (boundary + 30) % 360, t_enter + 30 / _MOON_MEAN_MOTION)
+        if t_exit is None:
+            return None
+        
+        # Interior days are safely in the sign; re-check the two edge days against the ephemeris
+        first = max(0, math.ceil(t_enter - 1e-4))
+        last = min(num_days, math.ceil(t_exit + 1e-4))
+        days.extend(
+            day for day in range(first, last)
+            if (day != first and day != last - 1) or in_sign(day)
+        )
+        t_guess = t_enter + _SIDEREAL_MONTH
     
-    return strengths[:3]
+    return days
+
 
+# Memoized horoscopes per birth data, location (to 2 decimals) and day, week or month
+HOROSCOPE_CACHE_SIZE = 10000
 
-def generate_daily_horoscope(birth_date: str, birth_time: str, lat: float, lon: float) -> Dict[str, Any]:
+# Daily and weekly horoscopes are calculated at local noon of their day
+_HOROSCOPE_TIME = time(12)
+
+
+def generate_daily_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                             as_of: datetime = None) -> Dict[str, Any]:
     """
     Generate daily horoscope based on Moon sign (Rashi)
-    Uses current day's transits to provide personalized predictions
+    Uses current day's transits (or those at as_of) to provide personalized predictions
     """
+    day = (as_of or datetime.now()).date()
+    return copy.deepcopy(_daily_horoscope(birth_date, birth_time, round(lat, 2), round(lon, 2), day))
+
+
+@lru_cache(maxsize=HOROSCOPE_CACHE_SIZE)
+def _daily_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                     day: date) -> Dict[str, Any]:
+    """Daily horoscope for one day (shared; callers copy it)"""
     
-    # Calculate birth chart to get Moon sign
-    natal_chart = calculate_chart(birth_date, birth_time, lat, lon)
-    moon_sign = natal_chart["planets"]["Moon"]["sign"]
-    ascendant_sign = natal_chart["ascendant"]["sign"]
+    # Birth chart Moon sign and ascendant (cached per birth data)
+    moon_sign, ascendant_sign = _natal_signs(birth_date, birth_time, lat, lon)
     
-    # Get today's date
-    today = datetime.now()
+    today = datetime.combine(day, _HOROSCOPE_TIME)
     jd = LocalCalculate.get_julian_day(today)
-    ayanamsa = LocalCalculate.get_ayanamsa(jd)
-    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
     
     # Calculate today's planetary positions
-    transits = {}
-    for planet_name in [PlanetName.SUN, PlanetName.MOON, PlanetName.MARS,
-                       PlanetName.MERCURY, PlanetName.JUPITER, PlanetName.VENUS,
-                       PlanetName.SATURN]:
-        planet_long = LocalCalculate.get_planet_longitude(planet_name, jd, ayanamsa)
-        planet_house = LocalCalculate.get_planet_house(planet_long, house_cusps)
-        planet_sign, degrees = LocalCalculate.longitude_to_sign(planet_long)
-        nakshatra, pada = LocalCalculate.get_nakshatra(planet_long)
-        
-        transits[planet_name] = {
-            "longitude": round(planet_long, 2),
-            "sign": planet_sign,
-            "house": planet_house,
-            "degrees": round(degrees, 2),
-            "nakshatra": nakshatra,
-            "pada": pada
-        }
-    
-    # Calculate Moon's current position relative to birth Moon
-    moon_transit = transits["Moon"]
-    moon_sign_index = ZODIAC_SIGNS.index(moon_sign)
-    current_moon_index = ZODIAC_SIGNS.index(moon_transit["sign"])
+    longitudes, signs, houses, _ = _compute_transits(round(jd, 6), round(lat, 4), round(lon, 4))
+    moon_nakshatra = NAKSHATRAS[int(longitudes[P_MOON] / 13.333333)]
     
     # Calculate which house Moon is transiting from natal Moon (Chandra Lagna)
-    moon_house_from_moon = ((current_moon_index - moon_sign_index) % 12) + 1
+    moon_house_from_moon = ((signs[P_MOON] - _SIGN_INDEX[moon_sign]) % 12) + 1
     
     # Interpret based on Moon's transit house from natal Moon
-    moon_transit_effects = {
-        1: {"mood": "Confident", "energy": 8, "advice": "Good day for personal initiatives and self-expression"},
-        2: {"mood": "Stable", "energy": 7, "advice": "Focus on finances and family matters"},
-        3: {"mood": "Active", "energy": 8, "advice": "Communication and short travels favored"},
-        4: {"mood": "Comfortable", "energy": 6, "advice": "Spend time at home, nurture emotional wellbeing"},
-        5: {"mood": "Creative", "energy": 9, "advice": "Excellent for romance, creativity, and speculation"},
-        6: {"mood": "Challenging", "energy": 5, "advice": "Be cautious with health and conflicts"},
-        7: {"mood": "Social", "energy": 8, "advice": "Good for partnerships and collaborations"},
-        8: {"mood": "Introspective", "energy": 4, "advice": "Avoid major decisions, focus on research and introspection"},
-        9: {"mood": "Optimistic", "energy": 9, "advice": "Luck and fortune favor you, pursue higher goals"},
-        10: {"mood": "Ambitious", "energy": 8, "advice": "Career matters highlighted, seek recognition"},
-        11: {"mood": "Rewarding", "energy": 9, "advice": "Gains and fulfillment of desires indicated"},
-        12: {"mood": "Reflective", "energy": 5, "advice": "Time for spirituality and letting go, avoid expenses"}
-    }
-    
-    moon_effect = moon_transit_effects.get(moon_house_from_moon, moon_transit_effects[1])
+    mood, energy, daily_advice = _MOON_TRANSIT_EFFECTS[moon_house_from_moon - 1]
     
     # Analyze key transits
     key_influences = []
     
     # Jupiter's influence
-    jupiter_house = transits["Jupiter"]["house"]
-    if jupiter_house in [1, 2, 5, 7, 9, 11]:
+    jupiter_house = houses[P_JUPITER]
+    if jupiter_house in _JUPITER_GOOD_HOUSES:
         key_influences.append(f"Jupiter in {jupiter_house}th house brings expansion and growth")
     
     # Saturn's influence
-    saturn_house = transits["Saturn"]["house"]
-    if saturn_house in [3, 6, 11]:
+    saturn_house = houses[P_SATURN]
+    if saturn_house in _SATURN_REWARD_HOUSES:
         key_influences.append(f"Saturn in {saturn_house}th house brings discipline and rewards for hard work")
-    elif saturn_house in [1, 4, 7, 8, 10, 12]:
+    elif saturn_house in _SATURN_HARD_HOUSES:
         key_influences.append(f"Saturn in {saturn_house}th house requires patience and perseverance")
     
     # Mars energy
-    mars_house = transits["Mars"]["house"]
-    if mars_house in [1, 3, 6, 10, 11]:
+    mars_house = houses[P_MARS]
+    if mars_house in _MARS_DAILY_GOOD_HOUSES:
         key_influences.append(f"Mars in {mars_house}th house provides energy and courage")
     
     # Venus for relationships and pleasures
-    venus_house = transits["Venus"]["house"]
-    if venus_house in [1, 2, 5, 7, 11]:
+    venus_house = houses[P_VENUS]
+    if venus_house in _VENUS_DAILY_GOOD_HOUSES:
         key_influences.append(f"Venus in {venus_house}th house enhances harmony and pleasures")
     
     # Lucky number based on day and Moon nakshatra
@@ -1632,32 +1977,23 @@ def generate_daily_horoscope(birth_date: str, birth_time: str, lat: float, lon:
     lucky_numbers = [(day_num % 9) + 1, (day_num % 9) + 2]
     
     # Lucky color based on current weekday
-    weekday_colors = {
-        0: "White",      # Monday - Moon
-        1: "Red",        # Tuesday - Mars
-        2: "Green",      # Wednesday - Mercury
-        3: "Yellow",     # Thursday - Jupiter
-        4: "White",      # Friday - Venus
-        5: "Blue",       # Saturday - Saturn
-        6: "Orange"      # Sunday - Sun
-    }
-    lucky_color = weekday_colors[today.weekday()]
+    lucky_color = _WEEKDAY_COLORS[today.weekday()]
     
     return {
         "date": today.strftime("%Y-%m-%d"),
         "day": today.strftime("%A"),
         "moon_sign": moon_sign,
         "ascendant": ascendant_sign,
-        "overall_rating": moon_effect["energy"],
-        "mood": moon_effect["mood"],
-        "energy_level": f"{moon_effect['energy']}/10",
-        "daily_advice": moon_effect["advice"],
+        "overall_rating": energy,
+        "mood": mood,
+        "energy_level": f"{energy}/10",
+        "daily_advice": daily_advice,
         "key_influences": key_influences[:3],
         "current_transits": {
-            "moon": f"{moon_transit['sign']} - {moon_transit['nakshatra']}",
-            "sun": f"{transits['Sun']['sign']}",
-            "jupiter": f"{transits['Jupiter']['sign']} (House {jupiter_house})",
-            "saturn": f"{transits['Saturn']['sign']} (House {saturn_house})"
+            "moon": f"{ZODIAC_SIGNS[signs[P_MOON]]} - {moon_nakshatra}",
+            "sun": f"{ZODIAC_SIGNS[signs[P_SUN]]}",
+            "jupiter": f"{ZODIAC_SIGNS[signs[P_JUPITER]]} (House {jupiter_house})",
+            "saturn": f"{ZODIAC_SIGNS[signs[P_SATURN]]} (House {saturn_house})"
         },
         "lucky_elements": {
             "color": lucky_color,
@@ -1665,111 +2001,100 @@ def generate_daily_horoscope(birth_date: str, birth_time: str, lat: float, lon:
             "time": "Early morning (6-8 AM) and Evening (6-8 PM)"
         },
         "areas_of_focus": {
-            "favorable": _get_favorable_areas(moon_house_from_moon, transits),
-            "caution": _get_caution_areas(moon_house_from_moon, transits)
+            "favorable": _get_favorable_areas(moon_house_from_moon, jupiter_house),
+            "caution": _get_caution_areas(moon_house_from_moon, saturn_house, mars_house)
         }
     }
 
 
-def generate_weekly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float) -> Dict[str, Any]:
+def generate_weekly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                              as_of: datetime = None) -> Dict[str, Any]:
     """
     Generate weekly horoscope based on Moon sign
-    Analyzes the week ahead using planetary transits
+    Analyzes the week ahead (or the week of as_of) using planetary transits
     """
+    day = (as_of or datetime.now()).date()
+    week_start = day - timedelta(days=day.weekday())  # Monday
+    return copy.deepcopy(_weekly_horoscope(birth_date, birth_time, round(lat, 2), round(lon, 2), week_start))
+
+
+@lru_cache(maxsize=HOROSCOPE_CACHE_SIZE)
+def _weekly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                      monday: date) -> Dict[str, Any]:
+    """Weekly horoscope for the week starting on monday (shared; callers copy it)"""
     
-    # Calculate birth chart
-    natal_chart = calculate_chart(birth_date, birth_time, lat, lon)
-    moon_sign = natal_chart["planets"]["Moon"]["sign"]
-    ascendant_sign = natal_chart["ascendant"]["sign"]
+    # Birth chart Moon sign and ascendant (cached per birth data)
+    moon_sign, ascendant_sign = _natal_signs(birth_date, birth_time, lat, lon)
     
     # Get current week dates
-    today = datetime.now()
-    week_start = today - timedelta(days=today.weekday())  # Monday
+    week_start = datetime.combine(monday, _HOROSCOPE_TIME)
     week_end = week_start + timedelta(days=6)  # Sunday
     
     # Analyze mid-week (Wednesday) transits for overall week
     mid_week = week_start + timedelta(days=2)
     jd = LocalCalculate.get_julian_day(mid_week)
-    ayanamsa = LocalCalculate.get_ayanamsa(jd)
-    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
     
     # Calculate planetary positions for the week
-    week_transits = {}
-    for planet_name in [PlanetName.SUN, PlanetName.MOON, PlanetName.MARS,
-                       PlanetName.MERCURY, PlanetName.JUPITER, PlanetName.VENUS,
-                       PlanetName.SATURN]:
-        planet_long = LocalCalculate.get_planet_longitude(planet_name, jd, ayanamsa)
-        planet_house = LocalCalculate.get_planet_house(planet_long, house_cusps)
-        planet_sign, degrees = LocalCalculate.longitude_to_sign(planet_long)
-        
-        week_transits[planet_name] = {
-            "sign": planet_sign,
-            "house": planet_house,
-            "degrees": round(degrees, 2)
-        }
+    _, signs, houses, _ = _compute_transits(round(jd, 6), round(lat, 4), round(lon, 4))
     
     # Calculate week rating based on major planet positions
     week_score = 5  # Base score
+    jupiter_house = houses[P_JUPITER]
+    saturn_house = houses[P_SATURN]
+    mars_house = houses[P_MARS]
     
     # Jupiter influence
-    if week_transits["Jupiter"]["house"] in [1, 2, 5, 7, 9, 11]:
+    if jupiter_house in _JUPITER_GOOD_HOUSES:
         week_score += 2
     
     # Saturn influence
-    if week_transits["Saturn"]["house"] in [3, 6, 11]:
+    if saturn_house in _SATURN_REWARD_HOUSES:
         week_score += 1
-    elif week_transits["Saturn"]["house"] in [8, 12]:
+    elif saturn_house in _LOSS_HOUSES:
         week_score -= 1
     
     # Mars influence
-    if week_transits["Mars"]["house"] in [3, 6, 10, 11]:
+    if mars_house in _MARS_GOOD_HOUSES:
         week_score += 1
-    elif week_transits["Mars"]["house"] in [8, 12]:
+    elif mars_house in _LOSS_HOUSES:
         week_score -= 1
     
     week_score = max(1, min(10, week_score))
     
-    # Day-by-day brief predictions
-    daily_highlights = []
-    current_day = week_start
-    
-    for i in range(7):
-        day_jd = LocalCalculate.get_julian_day(current_day)
-        day_ayanamsa = LocalCalculate.get_ayanamsa(day_jd)
-        
-        # Get Moon's position for each day
-        moon_long = LocalCalculate.get_planet_longitude(PlanetName.MOON, day_jd, day_ayanamsa)
-        moon_sign_day, _ = LocalCalculate.longitude_to_sign(moon_long)
-        nakshatra, _ = LocalCalculate.get_nakshatra(moon_long)
-        
-        # Simple day rating based on Moon nakshatra
-        favorable_nakshatras = ["Rohini", "Pushya", "Hasta", "Shravana", "Revati", "Ashwini", "Uttara Phalguni"]
-        day_quality = "Good" if nakshatra in favorable_nakshatras else "Moderate"
-        
-        daily_highlights.append({
-            "date": current_day.strftime("%Y-%m-%d"),
-            "day": current_day.strftime("%A"),
-            "moon_transit": moon_sign_day,
-            "nakshatra": nakshatra,
-            "quality": day_quality
-        })
-        
-        current_day += timedelta(days=1)
+    # Day-by-day brief predictions from one batch of daily Moon longitudes
+    day_jds = LocalCalculate.get_julian_day(week_start) + np.arange(7)
+    moon_longs = LocalCalculate.get_planet_longitudes_batch(
+        [PlanetName.MOON], day_jds, np.array([_ayanamsa_day(int(day_jd)) for day_jd in day_jds.tolist()])
+    )[:, 0]
+    day_signs = _ZODIAC_SIGN_NAMES[(moon_longs / 30).astype(int)].tolist()
+    day_nakshatras = _NAKSHATRA_NAMES[(moon_longs / 13.333333).astype(int)].tolist()
+    
+    # Simple day rating based on Moon nakshatra (week_start is a Monday)
+    daily_highlights = [
+        {
+            "date": (week_start + timedelta(days=i)).strftime("%Y-%m-%d"),
+            "day": _DAY_NAMES[i],
+            "moon_transit": day_signs[i],
+            "nakshatra": day_nakshatras[i],
+            "quality": "Good" if day_nakshatras[i] in _GOOD_DAY_NAKSHATRAS else "Moderate"
+        }
+        for i in range(7)
+    ]
     
     # Weekly themes based on transit patterns
     weekly_themes = []
     
     # Check for significant aspects or patterns
-    sun_house = week_transits["Sun"]["house"]
-    if sun_house in [1, 5, 9, 10]:
+    sun_house = houses[P_SUN]
+    if sun_house in _SUN_RECOGNITION_HOUSES:
         weekly_themes.append("Career and personal recognition highlighted")
     
-    venus_house = week_transits["Venus"]["house"]
-    if venus_house in [1, 5, 7]:
+    venus_house = houses[P_VENUS]
+    if venus_house in _VENUS_WEEKLY_GOOD_HOUSES:
         weekly_themes.append("Relationships and social connections flourish")
     
-    mercury_house = week_transits["Mercury"]["house"]
-    if mercury_house in [1, 2, 3, 10]:
+    mercury_house = houses[P_MERCURY]
+    if mercury_house in _MERCURY_WEEKLY_GOOD_HOUSES:
         weekly_themes.append("Communication and business matters favored")
     
     return {
@@ -1780,95 +2105,85 @@ def generate_weekly_horoscope(birth_date: str, birth_time: str, lat: float, lon:
         "week_summary": _generate_week_summary(week_score, weekly_themes),
         "weekly_themes": weekly_themes,
         "key_transits": {
-            "jupiter": f"{week_transits['Jupiter']['sign']} (House {week_transits['Jupiter']['house']})",
-            "saturn": f"{week_transits['Saturn']['sign']} (House {week_transits['Saturn']['house']})",
-            "mars": f"{week_transits['Mars']['sign']} (House {week_transits['Mars']['house']})",
-            "venus": f"{week_transits['Venus']['sign']} (House {week_transits['Venus']['house']})"
+            "jupiter": f"{ZODIAC_SIGNS[signs[P_JUPITER]]} (House {jupiter_house})",
+            "saturn": f"{ZODIAC_SIGNS[signs[P_SATURN]]} (House {saturn_house})",
+            "mars": f"{ZODIAC_SIGNS[signs[P_MARS]]} (House {mars_house})",
+            "venus": f"{ZODIAC_SIGNS[signs[P_VENUS]]} (House {venus_house})"
         },
         "daily_highlights": daily_highlights,
         "best_days": [d["day"] for d in daily_highlights if d["quality"] == "Good"][:3],
         "areas_to_focus": {
-            "career": _rate_area_for_period("career", week_transits),
-            "relationships": _rate_area_for_period("relationships", week_transits),
-            "finance": _rate_area_for_period("finance", week_transits),
-            "health": _rate_area_for_period("health", week_transits)
+            "career": _rate_area_for_period("career", houses),
+            "relationships": _rate_area_for_period("relationships", houses),
+            "finance": _rate_area_for_period("finance", houses),
+            "health": _rate_area_for_period("health", houses)
         }
     }
 
 
-def generate_monthly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float) -> Dict[str, Any]:
+def generate_monthly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                               as_of: datetime = None) -> Dict[str, Any]:
     """
     Generate monthly horoscope based on Moon sign
-    Provides comprehensive monthly outlook using major transits
+    Provides comprehensive monthly outlook (for the month of as_of) using major transits
     """
+    today = as_of or datetime.now()
+    return copy.deepcopy(_monthly_horoscope(
+        birth_date, birth_time, round(lat, 2), round(lon, 2), today.year, today.month
+    ))
+
+
+@lru_cache(maxsize=HOROSCOPE_CACHE_SIZE)
+def _monthly_horoscope(birth_date: str, birth_time: str, lat: float, lon: float,
+                       year: int, month: int) -> Dict[str, Any]:
+    """Monthly horoscope for one calendar month (shared; callers copy it)"""
     
-    # Calculate birth chart
-    natal_chart = calculate_chart(birth_date, birth_time, lat, lon)
-    moon_sign = natal_chart["planets"]["Moon"]["sign"]
-    ascendant_sign = natal_chart["ascendant"]["sign"]
-    
-    # Get current month dates
-    today = datetime.now()
-    month_start = datetime(today.year, today.month, 1)
+    # Birth chart Moon sign and ascendant (cached per birth data)
+    moon_sign, ascendant_sign = _natal_signs(birth_date, birth_time, lat, lon)
     
-    # Calculate last day of month
-    if today.month == 12:
-        month_end = datetime(today.year + 1, 1, 1) - timedelta(days=1)
-    else:
-        month_end = datetime(today.year, today.month + 1, 1) - timedelta(days=1)
+    # Get the month's dates
+    month_start = datetime(year, month, 1)
+    num_days = calendar.monthrange(year, month)[1]
+    month_end = month_start.replace(day=num_days)
     
     # Analyze mid-month transits
     mid_month = month_start + timedelta(days=15)
     jd = LocalCalculate.get_julian_day(mid_month)
-    ayanamsa = LocalCalculate.get_ayanamsa(jd)
-    house_cusps = LocalCalculate.get_house_cusps(jd, lat, lon, ayanamsa)
+    ayanamsa = _ayanamsa_day(int(jd))
     
     # Calculate major planetary positions for the month
-    month_transits = {}
-    for planet_name in [PlanetName.SUN, PlanetName.MARS, PlanetName.MERCURY,
-                       PlanetName.JUPITER, PlanetName.VENUS, PlanetName.SATURN]:
-        planet_long = LocalCalculate.get_planet_longitude(planet_name, jd, ayanamsa)
-        planet_house = LocalCalculate.get_planet_house(planet_long, house_cusps)
-        planet_sign, degrees = LocalCalculate.longitude_to_sign(planet_long)
-        is_retro = LocalCalculate.is_planet_retrograde(planet_name, jd)
-        
-        month_transits[planet_name] = {
-            "sign": planet_sign,
-            "house": planet_house,
-            "degrees": round(degrees, 2),
-            "retrograde": is_retro
-        }
+    _, signs, houses, retrograde = _compute_transits(round(jd, 6), round(lat, 4), round(lon, 4))
     
     # Calculate overall month rating
     month_score = 5
     
     # Jupiter's monthly influence
-    jupiter_house = month_transits["Jupiter"]["house"]
-    if jupiter_house in [1, 2, 5, 7, 9, 11]:
+    jupiter_house = houses[P_JUPITER]
+    if jupiter_house in _JUPITER_GOOD_HOUSES:
         month_score += 2
         jupiter_effect = "highly favorable"
-    elif jupiter_house in [6, 8, 12]:
+    elif jupiter_house in _DUSTHANA_HOUSES:
         jupiter_effect = "requires patience"
     else:
         jupiter_effect = "neutral"
     
     # Saturn's monthly influence
-    saturn_house = month_transits["Saturn"]["house"]
-    if saturn_house in [3, 6, 11]:
+    saturn_house = houses[P_SATURN]
+    if saturn_house in _SATURN_REWARD_HOUSES:
         month_score += 1
         saturn_effect = "rewards hard work"
-    elif saturn_house in [1, 4, 7, 8, 10, 12]:
+    elif saturn_house in _SATURN_HARD_HOUSES:
         month_score -= 1
         saturn_effect = "brings challenges requiring persistence"
     else:
         saturn_effect = "neutral"
     
     # Mars energy for the month
-    mars_house = month_transits["Mars"]["house"]
-    if mars_house in [3, 6, 10, 11]:
+    mars_house = houses[P_MARS]
+    if mars_house in _MARS_GOOD_HOUSES:
         month_score += 1
         mars_effect = "energizes"
-    elif mars_house in [8, 12]:
+    elif mars_house in _LOSS_HOUSES:
         mars_effect = "requires caution"
     else:
         mars_effect = "moderate"
@@ -1879,41 +2194,49 @@ def generate_monthly_horoscope(birth_date: str, birth_time: str, lat: float, lon
     key_dates = []
     
     # Find days when Moon is in same sign as natal Moon (emotional high points)
-    current_check = month_start
-    while current_check <= month_end:
-        check_jd = LocalCalculate.get_julian_day(current_check)
-        check_ayanamsa = LocalCalculate.get_ayanamsa(check_jd)
-        moon_long = LocalCalculate.get_planet_longitude(PlanetName.MOON, check_jd, check_ayanamsa)
-        moon_sign_check, _ = LocalCalculate.longitude_to_sign(moon_long)
-        
-        if moon_sign_check == moon_sign:
-            key_dates.append({
-                "date": current_check.strftime("%Y-%m-%d"),
-                "significance": "Moon returns to your sign - good for personal matters"
-            })
-        
-        current_check += timedelta(days=1)
+    # by solving for its sign entry/exit, at the mid-month ayanamsa
+    # (its drift over a month is far below a sign boundary)
+    start_jd = LocalCalculate.get_julian_day(month_start)
+    return_days = _moon_sign_days(start_jd, num_days, ayanamsa, _SIGN_INDEX[moon_sign])
+    if return_days is None:
+        # Fall back to one batch of daily Moon longitudes
+        moon_longs = LocalCalculate.get_planet_longitudes_batch(
+            [PlanetName.MOON], start_jd + np.arange(num_days), np.full(num_days, ayanamsa)
+        )[:, 0]
+        return_days = np.flatnonzero((moon_longs / 30).astype(int) == _SIGN_INDEX[moon_sign]).tolist()
+    
+    for day in return_days:
+        key_dates.append({
+            "date": (month_start + timedelta(days=day)).strftime("%Y-%m-%d"),
+            "significance": "Moon returns to your sign - good for personal matters"
+        })
     
     # Monthly themes
     monthly_themes = []
     
-    sun_house = month_transits["Sun"]["house"]
-    if sun_house in [1, 5, 9, 10]:
+    sun_house = houses[P_SUN]
+    if sun_house in _SUN_RECOGNITION_HOUSES:
         monthly_themes.append("Personal growth and recognition")
-    elif sun_house in [2, 11]:
+    elif sun_house in _SUN_GAIN_HOUSES:
         monthly_themes.append("Financial gains and stability")
     
-    if month_transits["Venus"]["house"] in [1, 5, 7, 11]:
+    if houses[P_VENUS] in _VENUS_GOOD_HOUSES:
         monthly_themes.append("Harmonious relationships and social pleasures")
     
-    if month_transits["Mercury"]["house"] in [1, 3, 6, 10]:
+    if houses[P_MERCURY] in _MERCURY_GOOD_HOUSES:
         monthly_themes.append("Enhanced communication and intellectual pursuits")
     
     # Check for retrograde impacts
-    retrograde_planets = [p for p, data in month_transits.items() if data.get("retrograde")]
+    retrograde_planets = [HOROSCOPE_PLANETS[p] for p in _RETROGRADE_PLANET_IDS if retrograde[p]]
     if retrograde_planets:
         monthly_themes.append(f"{', '.join(retrograde_planets)} retrograde - review and revise")
     
+    # Rate each life area once and derive its advice from that rating
+    areas_forecast = {}
+    for area in ("career", "relationships", "finance", "health"):
+        area_rating = _rate_area_for_period(area, houses)
+        areas_forecast[area] = {"rating": area_rating, "advice": _get_area_advice(area, area_rating)}
+    
     return {
         "month": month_start.strftime("%B %Y"),
         "period": f"{month_start.strftime('%B %d')} - {month_end.strftime('%B %d, %Y')}",
@@ -1924,89 +2247,55 @@ def generate_monthly_horoscope(birth_date: str, birth_time: str, lat: float, lon
         "key_themes": monthly_themes[:4],
         "major_transits": {
             "jupiter": {
-                "position": f"{month_transits['Jupiter']['sign']} (House {jupiter_house})",
+                "position": f"{ZODIAC_SIGNS[signs[P_JUPITER]]} (House {jupiter_house})",
                 "effect": jupiter_effect
             },
             "saturn": {
-                "position": f"{month_transits['Saturn']['sign']} (House {saturn_house})",
+                "position": f"{ZODIAC_SIGNS[signs[P_SATURN]]} (House {saturn_house})",
                 "effect": saturn_effect
             },
             "mars": {
-                "position": f"{month_transits['Mars']['sign']} (House {mars_house})",
+                "position": f"{ZODIAC_SIGNS[signs[P_MARS]]} (House {mars_house})",
                 "effect": mars_effect
             }
         },
         "retrograde_planets": retrograde_planets,
         "key_dates": key_dates[:3],  # Top 3 significant dates
-        "areas_forecast": {
-            "career": {
-                "rating": _rate_area_for_period("career", month_transits),
-                "advice": _get_area_advice("career", month_transits)
-            },
-            "relationships": {
-                "rating": _rate_area_for_period("relationships", month_transits),
-                "advice": _get_area_advice("relationships", month_transits)
-            },
-            "finance": {
-                "rating": _rate_area_for_period("finance", month_transits),
-                "advice": _get_area_advice("finance", month_transits)
-            },
-            "health": {
-                "rating": _rate_area_for_period("health", month_transits),
-                "advice": _get_area_advice("health", month_transits)
-            }
-        },
+        "areas_forecast": areas_forecast,
         "lucky_days": [d["date"] for d in key_dates]
     }
 
 
+def generate_full_forecast(birth_date: str, birth_time: str, lat: float, lon: float,
+                           as_of: datetime = None) -> Dict[str, Any]:
+    """
+    Generate daily, weekly and monthly horoscopes together
+    All three are calculated for the same as_of (default: now)
+    """
+    as_of = as_of or datetime.now()
+    return {
+        "daily": generate_daily_horoscope(birth_date, birth_time, lat, lon, as_of),
+        "weekly": generate_weekly_horoscope(birth_date, birth_time, lat, lon, as_of),
+        "monthly": generate_monthly_horoscope(birth_date, birth_time, lat, lon, as_of)
+    }
+
+
 # Helper functions for horoscope generation
 
-def _get_favorable_areas(moon_house: int, transits: Dict) -> List[str]:
+def _get_favorable_areas(moon_house: int, jupiter_house: int) -> List[str]:
     """Get favorable areas based on Moon position and transits"""
-    favorable = []
-    
-    house_areas = {
-        1: ["Personal growth", "New initiatives"],
-        2: ["Financial planning", "Family time"],
-        3: ["Communication", "Learning"],
-        4: ["Home improvement", "Emotional bonding"],
-        5: ["Creative projects", "Romance"],
-        6: ["Health routines", "Service"],
-        7: ["Partnerships", "Negotiations"],
-        8: ["Research", "Transformation"],
-        9: ["Higher learning", "Travel"],
-        10: ["Career advancement", "Public recognition"],
-        11: ["Networking", "Achieving goals"],
-        12: ["Spirituality", "Letting go"]
-    }
-    
-    favorable = house_areas.get(moon_house, ["General wellbeing"])
-    
-    # Add transit-based favorable areas
-    if transits["Jupiter"]["house"] in [1, 5, 9]:
-        favorable.append("Learning and wisdom")
-    
-    return favorable[:3]
+    jupiter_trikona = jupiter_house in _TRIKONA_HOUSES
+    areas = _FAVORABLE_AREAS.get((moon_house, jupiter_trikona))
+    if areas is None:
+        areas = ("General wellbeing", "Learning and wisdom") if jupiter_trikona else ("General wellbeing",)
+    return list(areas)
 
 
-def _get_caution_areas(moon_house: int, transits: Dict) -> List[str]:
+def _get_caution_areas(moon_house: int, saturn_house: int, mars_house: int) -> List[str]:
     """Get areas requiring caution"""
-    caution = []
-    
-    if moon_house in [6, 8, 12]:
-        caution.append("Avoid major commitments")
-    
-    if transits["Saturn"]["house"] in [8, 12]:
-        caution.append("Financial caution advised")
-    
-    if transits["Mars"]["house"] in [6, 8, 12]:
-        caution.append("Manage anger and impulsiveness")
-    
-    if not caution:
-        caution = ["None significant"]
-    
-    return caution[:2]
+    return list(_CAUTION_AREAS[
+        moon_house in _DUSTHANA_HOUSES, saturn_house in _LOSS_HOUSES, mars_house in _DUSTHANA_HOUSES
+    ])
 
 
 def _generate_week_summary(rating: int, themes: List[str]) -> str:
@@ -2039,56 +2328,21 @@ def _generate_month_summary(rating: int, themes: List[str]) -> str:
     return f"{tone} {theme_text}"
 
 
-def _rate_area_for_period(area: str, transits: Dict) -> int:
-    """Rate a life area (1-10) based on transits"""
+def _rate_area_for_period(area: str, houses: Tuple[int, ...]) -> int:
+    """Rate a life area (1-10) based on transit houses (indexed by P_*)"""
     score = 5
     
-    area_planets = {
-        "career": ["Sun", "Saturn", "Jupiter"],
-        "relationships": ["Venus", "Jupiter"],
-        "finance": ["Jupiter", "Venus"],
-        "health": ["Sun", "Mars"]
-    }
-    
-    key_planets = area_planets.get(area, ["Jupiter"])
+    key_planets = _PERIOD_AREA_PLANETS.get(area, (P_JUPITER,))
     
     for planet in key_planets:
-        if planet in transits:
-            house = transits[planet]["house"]
-            if house in [1, 2, 5, 7, 9, 10, 11]:
-                score += 1
-            elif house in [6, 8, 12]:
-                score -= 1
+        house = houses[planet]
+        score += (_AREA_GOOD_MASK >> house) & 1
+        score -= (_MALEFIC_MASK >> house) & 1
     
     return max(1, min(10, score))
 
 
-def _get_area_advice(area: str, transits: Dict) -> str:
-    """Get specific advice for a life area"""
-    rating = _rate_area_for_period(area, transits)
-    
-    advice_map = {
-        "career": {
-            "high": "Excellent time for career advancement. Take initiative on important projects.",
-            "medium": "Steady progress in career. Focus on building skills and relationships.",
-            "low": "Career challenges require patience. Avoid major changes, focus on stability."
-        },
-        "relationships": {
-            "high": "Harmonious period for relationships. Good time for commitments.",
-            "medium": "Relationships stable. Communication is key to growth.",
-            "low": "Relationships need attention. Practice patience and understanding."
-        },
-        "finance": {
-            "high": "Financial gains indicated. Good time for investments.",
-            "medium": "Financial stability maintained. Plan for future growth.",
-            "low": "Financial caution advised. Avoid risks and focus on saving."
-        },
-        "health": {
-            "high": "Good vitality and energy. Maintain healthy routines.",
-            "medium": "Health stable. Regular exercise and diet important.",
-            "low": "Health needs attention. Avoid stress and maintain regular checkups."
-        }
-    }
-    
+def _get_area_advice(area: str, rating: int) -> str:
+    """Get specific advice for a life area from its period rating"""
     level = "high" if rating >= 7 else "medium" if rating >= 5 else "low"
-    return advice_map.get(area, {}).get(level, "Stay balanced and mindful.")
\ No newline at end of file
+    return _AREA_ADVICE.get(area, {}).get(level, "Stay balanced and mindful.")
\ No newline at end of file
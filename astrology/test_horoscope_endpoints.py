@@ -5,10 +5,21 @@ Test script for new horoscope endpoints
 
 import requests
 import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API base URL
 BASE_URL = "http://192.168.0.200:8087"
 
+# One pooled session, so the endpoint tests reuse a keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
 # Test birth data
 test_data = {
     "date_of_birth": "1987-04-25",
@@ -16,19 +27,17 @@ test_data = {
     "place_of_birth": "Hisar, Haryana"
 }
 
-def test_daily_horoscope():
-    """Test daily horoscope endpoint"""
+def test_daily_horoscope(pending_response):
+    """Test daily horoscope endpoint (pending_response is the in-flight POST)"""
     print("\n" + "="*80)
     print("TESTING: Daily Horoscope Endpoint")
     print("="*80)
     
-    url = f"{BASE_URL}/horoscope/daily"
-    
     try:
-        response = requests.post(url, json=test_data, timeout=30)
+        response = pending_response.result()
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
         print(f"\n✅ Status: {response.status_code}")
         print(f"\n📅 Date: {result.get('date')} ({result.get('day')})")
@@ -61,19 +70,17 @@ def test_daily_horoscope():
         return False
 
 
-def test_weekly_horoscope():
-    """Test weekly horoscope endpoint"""
+def test_weekly_horoscope(pending_response):
+    """Test weekly horoscope endpoint (pending_response is the in-flight POST)"""
     print("\n" + "="*80)
     print("TESTING: Weekly Horoscope Endpoint")
     print("="*80)
     
-    url = f"{BASE_URL}/horoscope/weekly"
-    
     try:
-        response = requests.post(url, json=test_data, timeout=30)
+        response = pending_response.result()
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
         print(f"\n✅ Status: {response.status_code}")
         print(f"\n📅 Week Period: {result.get('week_period')}")
@@ -110,19 +117,17 @@ def test_weekly_horoscope():
         return False
 
 
-def test_monthly_horoscope():
-    """Test monthly horoscope endpoint"""
+def test_monthly_horoscope(pending_response):
+    """Test monthly horoscope endpoint (pending_response is the in-flight POST)"""
     print("\n" + "="*80)
     print("TESTING: Monthly Horoscope Endpoint")
     print("="*80)
     
-    url = f"{BASE_URL}/horoscope/monthly"
-    
     try:
-        response = requests.post(url, json=test_data, timeout=30)
+        response = pending_response.result()
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
         print(f"\n✅ Status: {response.status_code}")
         print(f"\n📅 Month: {result.get('month')}")
@@ -172,12 +177,21 @@ def main():
     print(f"\nBase URL: {BASE_URL}")
     print(f"Test Data: {test_data}")
     
-    results = {
-        "Daily Horoscope": test_daily_horoscope(),
-        "Weekly Horoscope": test_weekly_horoscope(),
-        "Monthly Horoscope": test_monthly_horoscope()
+    tests = {
+        "Daily Horoscope": ("/horoscope/daily", test_daily_horoscope),
+        "Weekly Horoscope": ("/horoscope/weekly", test_weekly_horoscope),
+        "Monthly Horoscope": ("/horoscope/monthly", test_monthly_horoscope)
     }
     
+    # The endpoint calls are independent, so send them together on the pooled
+    # session; each test then reports its response in order (no interleaved output)
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        pending = {
+            test_name: executor.submit(SESSION.post, f"{BASE_URL}{path}", json=test_data, timeout=30)
+            for test_name, (path, _) in tests.items()
+        }
+        results = {test_name: test(pending[test_name]) for test_name, (_, test) in tests.items()}
+    
     print("\n" + "="*80)
     print("TEST SUMMARY")
     print("="*80)
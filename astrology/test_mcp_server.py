@@ -3,13 +3,22 @@ Test script for Standalone MCP Server
 Demonstrates all available endpoints and tools
 """
 
-import requests
-import json
+import httpx
+import orjson
 from datetime import datetime
 
 # Configuration
 MCP_SERVER_URL = "http://localhost:8585"
 
+# One pooled client for every test; HTTP/2 is used when the server is behind
+# TLS, plain http:// stays on HTTP/1.1 keep-alive
+CLIENT = httpx.Client(
+    base_url=MCP_SERVER_URL,
+    http2=True,
+    timeout=60.0,  # matches the server's own upstream timeout
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+)
+
 # Test birth data
 TEST_DATA = {
     "date_of_birth": "1990-05-15",
@@ -29,19 +38,19 @@ def test_health_check():
     """Test health check endpoint"""
     print_separator("Testing Health Check")
     
-    response = requests.get(f"{MCP_SERVER_URL}/health")
+    response = CLIENT.get("/health")
     print(f"Status Code: {response.status_code}")
-    print(json.dumps(response.json(), indent=2))
+    print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
 
 
 def test_list_tools():
     """Test listing available tools"""
     print_separator("Listing Available Tools")
     
-    response = requests.get(f"{MCP_SERVER_URL}/tools")
+    response = CLIENT.get("/tools")
     print(f"Status Code: {response.status_code}")
     
-    tools = response.json()["tools"]
+    tools = orjson.loads(response.content)["tools"]
     print(f"Found {len(tools)} tools:\n")
     
     for tool in tools:
@@ -60,10 +69,10 @@ def test_execute_tool():
         "arguments": TEST_DATA
     }
     
-    response = requests.post(f"{MCP_SERVER_URL}/execute", json=payload)
+    response = CLIENT.post("/execute", json=payload)
     print(f"Status Code: {response.status_code}")
     
-    result = response.json()
+    result = orjson.loads(response.content)
     if result["success"]:
         print("✅ Tool executed successfully!")
         print(f"\nToday's Rating: {result['data']['prediction']['overall_rating']}/10")
@@ -78,10 +87,10 @@ def test_direct_endpoints():
     
     # Test today's prediction
     print("1. Today's Prediction:")
-    response = requests.post(f"{MCP_SERVER_URL}/today", json=TEST_DATA)
+    response = CLIENT.post("/today", json=TEST_DATA)
     print(f"   Status: {response.status_code}")
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"   Rating: {data['prediction']['overall_rating']}/10")
         print(f"   Summary: {data['prediction']['summary'][:100]}...")
     
@@ -89,10 +98,10 @@ def test_direct_endpoints():
     
     # Test birth chart
     print("2. Birth Chart:")
-    response = requests.post(f"{MCP_SERVER_URL}/birth-chart", json=TEST_DATA)
+    response = CLIENT.post("/birth-chart", json=TEST_DATA)
     print(f"   Status: {response.status_code}")
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"   Ascendant: {data['ascendant']['sign']}")
         print(f"   Moon Sign: {data['planets']['Moon']['sign']}")
         print(f"   Sun Sign: {data['planets']['Sun']['sign']}")
@@ -107,11 +116,11 @@ def test_wildcard_query():
         "query": "I have a job interview on December 15th, 2024. How will it go?"
     }
     
-    response = requests.post(f"{MCP_SERVER_URL}/wildcard", json=wildcard_data)
+    response = CLIENT.post("/wildcard", json=wildcard_data)
     print(f"Status Code: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ Query: {wildcard_data['query']}")
         print(f"\nSuccess Probability: {data.get('success_probability', {}).get('percentage', 'N/A')}%")
         print(f"Rating: {data.get('success_probability', {}).get('rating', 'N/A')}")
@@ -127,11 +136,11 @@ def test_love_prediction():
         "end_date": "2025-04-30"
     }
     
-    response = requests.post(f"{MCP_SERVER_URL}/love", json=love_data)
+    response = CLIENT.post("/love", json=love_data)
     print(f"Status Code: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ Love prediction generated!")
         print(f"\nPeriod: {data.get('period', 'N/A')}")
         
@@ -149,12 +158,12 @@ def run_all_tests():
     
     try:
         # Check if server is running
-        response = requests.get(MCP_SERVER_URL, timeout=2)
+        response = CLIENT.get("/", timeout=2)
         if response.status_code != 200:
             print(f"\n❌ MCP Server not responding at {MCP_SERVER_URL}")
             print("   Make sure the server is running: docker compose up -d")
             return
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"\n❌ Cannot connect to MCP Server at {MCP_SERVER_URL}")
         print("   Make sure the server is running: docker compose up -d")
         return
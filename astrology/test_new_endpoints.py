@@ -4,8 +4,10 @@ Test script for new enhanced prediction endpoints
 Tests 24-month predictions and wildcard endpoint
 """
 
-import requests
+import asyncio
+import httpx
 import json
+import orjson
 from datetime import datetime
 
 BASE_URL = "http://localhost:8000"
@@ -16,10 +18,16 @@ def print_section(title):
     print(f" {title}")
     print("="*80 + "\n")
 
-def test_love_predictions():
+async def post_test(client, title, path, data):
+    """POST a test payload; the section header prints once the call settles,
+    so concurrently running tests keep their output together"""
+    try:
+        return await client.post(path, json=data)
+    finally:
+        print_section(title)
+
+async def test_love_predictions(client):
     """Test 24-month love predictions"""
-    print_section("TEST 1: Love Predictions (24 Months)")
-    
     data = {
         "date_of_birth": "1990-05-15",
         "time_of_birth": "10:30",
@@ -27,9 +35,9 @@ def test_love_predictions():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/love", json=data, timeout=30)
+        response = await post_test(client, "TEST 1: Love Predictions (24 Months)", "/predictions/love", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success! Area: {result['area']}")
             print(f"📅 Period: {result['prediction_period']}")
             print(f"⭐ Average Rating: {result['overview']['average_rating']}/10")
@@ -46,10 +54,8 @@ def test_love_predictions():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def test_career_predictions():
+async def test_career_predictions(client):
     """Test 24-month career predictions"""
-    print_section("TEST 2: Career Predictions (24 Months)")
-    
     data = {
         "date_of_birth": "1985-08-22",
         "time_of_birth": "14:45",
@@ -57,9 +63,9 @@ def test_career_predictions():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/career", json=data, timeout=30)
+        response = await post_test(client, "TEST 2: Career Predictions (24 Months)", "/predictions/career", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success! Area: {result['area']}")
             print(f"📅 Period: {result['prediction_period']}")
             print(f"⭐ Average Rating: {result['overview']['average_rating']}/10")
@@ -78,10 +84,8 @@ def test_career_predictions():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def test_wildcard_date_query():
+async def test_wildcard_date_query(client):
     """Test wildcard endpoint with date query"""
-    print_section("TEST 3: Wildcard - Date Query")
-    
     data = {
         "date_of_birth": "1990-05-15",
         "time_of_birth": "10:30",
@@ -90,9 +94,9 @@ def test_wildcard_date_query():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/wildcard", json=data, timeout=30)
+        response = await post_test(client, "TEST 3: Wildcard - Date Query", "/predictions/wildcard", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success!")
             print(f"🔍 Query: {result['query']}")
             print(f"📅 Event Date: {result['event_date']['full_date']}")
@@ -122,10 +126,8 @@ def test_wildcard_date_query():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def test_wildcard_job_query():
+async def test_wildcard_job_query(client):
     """Test wildcard endpoint with job query"""
-    print_section("TEST 4: Wildcard - Job Security Query")
-    
     data = {
         "date_of_birth": "1988-03-10",
         "time_of_birth": "09:15",
@@ -135,9 +137,9 @@ def test_wildcard_job_query():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/wildcard", json=data, timeout=30)
+        response = await post_test(client, "TEST 4: Wildcard - Job Security Query", "/predictions/wildcard", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success!")
             print(f"🔍 Query: {result['query']}")
             print(f"📅 Event Date: {result['event_date']['full_date']}")
@@ -161,10 +163,8 @@ def test_wildcard_job_query():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def test_wildcard_safety_query():
+async def test_wildcard_safety_query(client):
     """Test wildcard endpoint with safety query"""
-    print_section("TEST 5: Wildcard - Motorcycle Safety Query")
-    
     data = {
         "date_of_birth": "1992-11-08",
         "time_of_birth": "18:20",
@@ -173,9 +173,9 @@ def test_wildcard_safety_query():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/wildcard", json=data, timeout=30)
+        response = await post_test(client, "TEST 5: Wildcard - Motorcycle Safety Query", "/predictions/wildcard", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success!")
             print(f"🔍 Query: {result['query']}")
             print(f"📅 Purchase Date: {result['event_date']['full_date']}")
@@ -200,10 +200,8 @@ def test_wildcard_safety_query():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def test_health_predictions():
+async def test_health_predictions(client):
     """Test 24-month health predictions"""
-    print_section("TEST 6: Health Predictions (24 Months)")
-    
     data = {
         "date_of_birth": "1995-02-14",
         "time_of_birth": "06:00",
@@ -211,9 +209,9 @@ def test_health_predictions():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/predictions/health", json=data, timeout=30)
+        response = await post_test(client, "TEST 6: Health Predictions (24 Months)", "/predictions/health", data)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Success! Area: {result['area']}")
             print(f"📅 Period: {result['prediction_period']}")
             print(f"⭐ Average Rating: {result['overview']['average_rating']}/10")
@@ -232,6 +230,33 @@ def test_health_predictions():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
+async def run_tests(tests):
+    """Check the API is up, then run every test concurrently on one pooled client"""
+    # HTTP/2 is used when the API is served over TLS; plain http:// stays on HTTP/1.1 keep-alive
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    ) as client:
+        # Check if API is running
+        try:
+            response = await client.get("/docs", timeout=5)
+            if response.status_code == 200:
+                print("✅ API is running!")
+            else:
+                print("⚠️  API responded but docs not accessible")
+        except Exception as e:
+            print(f"❌ Cannot connect to API: {str(e)}")
+            print("   Please start the API first: python app.py")
+            return False
+        
+        results = await asyncio.gather(*(test_func(client) for test_func in tests), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"\n❌ Test failed with error: {str(result)}")
+    return True
+
 def main():
     """Run all tests"""
     print("\n" + "🌟"*40)
@@ -240,18 +265,6 @@ def main():
     print(f"\nStarting tests at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Target API: {BASE_URL}")
     
-    # Check if API is running
-    try:
-        response = requests.get(f"{BASE_URL}/docs", timeout=5)
-        if response.status_code == 200:
-            print("✅ API is running!")
-        else:
-            print("⚠️  API responded but docs not accessible")
-    except Exception as e:
-        print(f"❌ Cannot connect to API: {str(e)}")
-        print("   Please start the API first: python app.py")
-        return
-    
     # Run tests
     tests = [
         test_love_predictions,
@@ -262,14 +275,11 @@ def main():
         test_health_predictions
     ]
     
-    for test_func in tests:
-        try:
-            test_func()
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Tests interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Test failed with error: {str(e)}")
+    try:
+        if not asyncio.run(run_tests(tests)):
+            return
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Tests interrupted by user")
     
     print_section("TEST SUMMARY")
     print("✅ All tests completed!")
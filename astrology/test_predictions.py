@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test script for the prediction engine without the optional numba dependency
+Runs wildcard and area predictions in a subprocess with numba blocked
+"""
+
+import os
+import subprocess
+import sys
+
+# Blocks the numba import so predictions falls back to plain Python
+NO_NUMBA_SCRIPT = """
+import sys
+sys.modules["numba"] = None
+
+from local_calculate import calculate_chart
+from predictions import generate_area_specific_predictions, generate_wildcard_prediction
+
+chart = calculate_chart("1990-05-15", "14:30", 28.6139, 77.2090)
+wildcard = generate_wildcard_prediction(chart, 28.6139, 77.2090, "Will I get a job on 2026-11-20?")
+assert 0 <= wildcard["success_probability"]["percentage"] <= 100, wildcard
+area = generate_area_specific_predictions(chart, 28.6139, 77.2090, "career")
+assert area, area
+print("ok")
+"""
+
+
+def test_predictions_without_numba():
+    """Wildcard and area predictions work when numba is not installed"""
+    result = subprocess.run(
+        [sys.executable, "-c", NO_NUMBA_SCRIPT],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
+
+
+if __name__ == "__main__":
+    test_predictions_without_numba()
+    print("✅ Predictions work without numba")
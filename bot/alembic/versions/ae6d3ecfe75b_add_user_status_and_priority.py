@@ -14,24 +14,32 @@ branch_labels = None
 depends_on = None
 
 def upgrade() -> None:
-    # Step 1: Add columns as NULLABLE first
-    op.add_column('users', sa.Column('is_active', sa.Boolean(), nullable=True))
-    op.add_column('users', sa.Column('priority', sa.Integer(), nullable=True))
+    # Add every later users column in one ALTER TABLE (strikes and encrypt_chats
+    # used to come from fbecb718ecfb / ed2c4bd96b0c). On PostgreSQL 11+ a NOT NULL
+    # column with a constant DEFAULT is metadata-only: no backfill, no rewrite
+    op.execute(
+        'ALTER TABLE users '
+        'ADD COLUMN is_active boolean NOT NULL DEFAULT true, '
+        'ADD COLUMN priority integer NOT NULL DEFAULT 5, '
+        'ADD COLUMN strikes integer NOT NULL DEFAULT 0, '
+        'ADD COLUMN encrypt_chats boolean NOT NULL DEFAULT false'
+    )
     
-    # Step 2: Set default values for existing rows
-    op.execute('UPDATE users SET is_active = true WHERE is_active IS NULL')
-    op.execute('UPDATE users SET priority = 5 WHERE priority IS NULL')
-    
-    # Step 3: Now make them NOT NULL
-    op.alter_column('users', 'is_active', nullable=False)
-    op.alter_column('users', 'priority', nullable=False)
-    
-    # Step 4: Add indexes
-    op.create_index('idx_users_priority', 'users', ['priority'])
-    op.create_index('idx_users_is_active', 'users', ['is_active'])
+    # Add indexes without blocking writes (CONCURRENTLY can't run in a transaction)
+    with op.get_context().autocommit_block():
+        op.create_index('idx_users_priority', 'users', ['priority'], postgresql_concurrently=True)
+        op.create_index('idx_users_is_active', 'users', ['is_active'], postgresql_concurrently=True)
+        op.create_index('idx_users_strikes', 'users', ['strikes'], postgresql_concurrently=True)
+        op.create_index('idx_users_encrypt_chats', 'users', ['encrypt_chats'], postgresql_concurrently=True)
 
 def downgrade() -> None:
-    op.drop_index('idx_users_is_active', table_name='users')
-    op.drop_index('idx_users_priority', table_name='users')
+    # strikes and encrypt_chats (and their indexes) are missing on databases that
+    # ran this revision before it was combined, so drop them only if present
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_users_encrypt_chats')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_users_strikes')
+        op.drop_index('idx_users_is_active', table_name='users', postgresql_concurrently=True)
+        op.drop_index('idx_users_priority', table_name='users', postgresql_concurrently=True)
+    op.execute('ALTER TABLE users DROP COLUMN IF EXISTS encrypt_chats, DROP COLUMN IF EXISTS strikes')
     op.drop_column('users', 'priority')
     op.drop_column('users', 'is_active')
\ No newline at end of file
@@ -19,30 +19,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add encrypt_chats column to users table
-    op.add_column('users', sa.Column('encrypt_chats', sa.Boolean(), nullable=True))
+    # encrypt_chats is now added with the other users columns in ae6d3ecfe75b; this
+    # only fills it in on databases that ran that revision before it was combined
+    op.execute('ALTER TABLE users ADD COLUMN IF NOT EXISTS encrypt_chats boolean NOT NULL DEFAULT false')
     
-    # Set default value for existing users (False = no encryption)
-    op.execute('UPDATE users SET encrypt_chats = false WHERE encrypt_chats IS NULL')
+    # Add is_encrypted column to chat_history table; NOT NULL with a constant
+    # server default fills existing chats without a backfill UPDATE
+    op.add_column('chat_history', sa.Column('is_encrypted', sa.Boolean(), nullable=False, server_default=sa.false()))
     
-    # Make it NOT NULL
-    op.alter_column('users', 'encrypt_chats', nullable=False)
-    
-    # Add is_encrypted column to chat_history table
-    op.add_column('chat_history', sa.Column('is_encrypted', sa.Boolean(), nullable=True, server_default='false'))
-    
-    # Set default value for existing chats
-    op.execute('UPDATE chat_history SET is_encrypted = false WHERE is_encrypted IS NULL')
-    
-    # Make it NOT NULL
-    op.alter_column('chat_history', 'is_encrypted', nullable=False)
-    
-    # Add indexes
-    op.create_index('idx_users_encrypt_chats', 'users', ['encrypt_chats'])
-    op.create_index('idx_chat_history_is_encrypted', 'chat_history', ['is_encrypted'])
+    # Add indexes without blocking writes (CONCURRENTLY can't run in a transaction)
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_encrypt_chats ON users (encrypt_chats)')
+        op.create_index('idx_chat_history_is_encrypted', 'chat_history', ['is_encrypted'],
+                        postgresql_concurrently=True)
 
 def downgrade() -> None:
-    op.drop_index('idx_chat_history_is_encrypted', table_name='chat_history')
-    op.drop_index('idx_users_encrypt_chats', table_name='users')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_chat_history_is_encrypted', table_name='chat_history', postgresql_concurrently=True)
     op.drop_column('chat_history', 'is_encrypted')
-    op.drop_column('users', 'encrypt_chats')
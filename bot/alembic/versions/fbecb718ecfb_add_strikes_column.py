@@ -19,18 +19,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add strikes column with default 0
-    op.add_column('users', sa.Column('strikes', sa.Integer(), nullable=True))
-    
-    # Set default value for existing users
-    op.execute('UPDATE users SET strikes = 0 WHERE strikes IS NULL')
-    
-    # Make it NOT NULL
-    op.alter_column('users', 'strikes', nullable=False)
-    
-    # Add index for faster filtering
-    op.create_index('idx_users_strikes', 'users', ['strikes'])
+    # strikes is now added with the other users columns in ae6d3ecfe75b; this
+    # only fills it in on databases that ran that revision before it was combined
+    op.execute('ALTER TABLE users ADD COLUMN IF NOT EXISTS strikes integer NOT NULL DEFAULT 0')
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_strikes ON users (strikes)')
 
 def downgrade() -> None:
-    op.drop_index('idx_users_strikes', table_name='users')
-    op.drop_column('users', 'strikes')
\ No newline at end of file
+    # strikes belongs to ae6d3ecfe75b, whose downgrade drops it
+    pass
\ No newline at end of file